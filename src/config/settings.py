@@ -29,6 +29,7 @@ class Settings:
     telegram_bot_token: str
     admin_chat_id: int = 0  # Admin user Telegram chat ID for critical notifications
     admin_user_id: int = 0  # Admin user Telegram ID for command access
+    bot_connection_pool_size: int = 16  # Pooled keep-alive connections to the Bot API
 
     # Database Configuration
     database_url: str = "sqlite:///./bot_data.db"
@@ -41,6 +42,7 @@ class Settings:
 
     # Claude API Configuration
     anthropic_api_key: str = ""
+    claude_batch_max_wait: int = 3600  # Seconds to poll a Message Batches job before cancelling it
 
     # Scheduler Configuration
     report_time_hour: int = 10  # 10:00 AM
@@ -55,6 +57,8 @@ class Settings:
     webhook_port: int = 8080  # Port for webhook HTTP server
     webhook_url: str = ""  # Full webhook URL (e.g., https://your-app.onrender.com/webhook)
     webhook_secret_token: str = ""  # Secret token for webhook validation
+    webhook_reuse_port: bool = False  # Bind with SO_REUSEPORT so several processes can share the port
+    max_concurrent_updates: int = 40  # Max updates processed at once (matches Telegram max_connections)
 
     @classmethod
     def from_env(cls) -> "Settings":
@@ -90,10 +94,12 @@ class Settings:
             telegram_bot_token=telegram_bot_token,
             admin_chat_id=int(os.getenv("ADMIN_CHAT_ID", "0")),
             admin_user_id=int(os.getenv("ADMIN_USER_ID", "0")),
+            bot_connection_pool_size=int(os.getenv("BOT_CONNECTION_POOL_SIZE", "16")),
             database_url=os.getenv("DATABASE_URL", "sqlite:///./bot_data.db"),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             message_retention_hours=int(os.getenv("MESSAGE_RETENTION_HOURS", "48")),
             anthropic_api_key=anthropic_api_key,
+            claude_batch_max_wait=int(os.getenv("CLAUDE_BATCH_MAX_WAIT", "3600")),
             report_time_hour=int(os.getenv("REPORT_TIME_HOUR", "10")),
             cleanup_time_hour=int(os.getenv("CLEANUP_TIME_HOUR", "2")),
             timezone=os.getenv("TIMEZONE", "UTC"),
@@ -101,7 +107,9 @@ class Settings:
             webhook_enabled=os.getenv("WEBHOOK_ENABLED", "false").lower() == "true",
             webhook_port=int(os.getenv("WEBHOOK_PORT", "8080")),
             webhook_url=os.getenv("WEBHOOK_URL", ""),
-            webhook_secret_token=os.getenv("WEBHOOK_SECRET_TOKEN", "")
+            webhook_secret_token=os.getenv("WEBHOOK_SECRET_TOKEN", ""),
+            webhook_reuse_port=os.getenv("WEBHOOK_REUSE_PORT", "false").lower() == "true",
+            max_concurrent_updates=int(os.getenv("MAX_CONCURRENT_UPDATES", "40"))
         )
 
 
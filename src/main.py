@@ -8,6 +8,14 @@ import logging
 import signal
 import sys
 from datetime import time
+from types import ModuleType
+from typing import Optional
+
+uvloop: Optional[ModuleType]
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -98,15 +106,7 @@ class BotApplication:
             logger.info("Starting Telegram Bot for IMF")
             logger.info("="*60)
 
-            # Add startup delay in production polling mode to avoid conflicts during rolling deployment
-            # This gives the old instance time to disconnect from Telegram API
-            # 60 seconds ensures old instance has fully shut down (45s shutdown + 15s buffer)
-            # Note: Webhook mode doesn't need this delay as it uses different connection pattern
-            if self.settings.environment == "production" and not self.settings.webhook_enabled:
-                startup_delay = 60  # seconds
-                logger.info(f"⏳ Production startup (polling mode): waiting {startup_delay}s for clean deployment...")
-                await asyncio.sleep(startup_delay)
-                logger.info("✅ Startup delay complete, proceeding with initialization")
+            await self._apply_startup_delay()
 
             # Initialize database
             logger.info("Initializing database...")
@@ -147,64 +147,10 @@ class BotApplication:
             async with self.application:
                 await self.application.start()
 
-                # Initialize webhook server if webhook mode is enabled
                 if self.settings.webhook_enabled:
-                    logger.info("="*60)
-                    logger.info("Starting in WEBHOOK mode")
-                    logger.info("="*60)
-
-                    # Create webhook server with the application instance
-                    self.webhook_server = WebhookServer(
-                        application=self.application,
-                        settings=self.settings
-                    )
-
-                    # Start webhook HTTP server
-                    await self.webhook_server.start()
-
-                    # Register webhook with Telegram
-                    await self.bot_service.setup_webhook(
-                        webhook_url=self.settings.webhook_url,
-                        secret_token=self.settings.webhook_secret_token
-                    )
-
-                    logger.info("="*60)
-                    logger.info("Bot is now running in WEBHOOK mode!")
-                    logger.info("Press Ctrl+C to stop")
-                    logger.info("="*60)
-
+                    await self._start_webhook_mode()
                 else:
-                    logger.info("="*60)
-                    logger.info("Starting in POLLING mode (development)")
-                    logger.info("="*60)
-
-                    # Retry polling start to handle temporary conflicts during deployment
-                    max_retries = 5
-                    retry_delay = 10  # seconds
-
-                    for attempt in range(max_retries):
-                        try:
-                            await self.application.updater.start_polling(
-                                allowed_updates=Update.ALL_TYPES,
-                                drop_pending_updates=True
-                            )
-                            logger.info("✅ Bot polling started successfully")
-                            break
-                        except Exception as e:
-                            if "Conflict" in str(e) and attempt < max_retries - 1:
-                                logger.warning(
-                                    f"⚠️ Conflict detected during polling start (attempt {attempt + 1}/{max_retries}). "
-                                    f"Previous bot instance still active. Retrying in {retry_delay}s..."
-                                )
-                                await asyncio.sleep(retry_delay)
-                                retry_delay *= 1.5  # Exponential backoff
-                            else:
-                                raise
-
-                    logger.info("="*60)
-                    logger.info("Bot is now running in POLLING mode!")
-                    logger.info("Press Ctrl+C to stop")
-                    logger.info("="*60)
+                    await self._start_polling_mode()
 
                 # Keep the bot running
                 await self._keep_running()
@@ -224,6 +170,81 @@ class BotApplication:
             await self.stop()
             sys.exit(1)
 
+    async def _apply_startup_delay(self) -> None:
+        """Wait before starting in production polling mode.
+
+        Avoids conflicts during rolling deployment by giving the old instance
+        time to disconnect from the Telegram API. 60 seconds ensures the old
+        instance has fully shut down (45s shutdown + 15s buffer). Webhook mode
+        doesn't need this delay as it uses a different connection pattern.
+        """
+        if self.settings.environment == "production" and not self.settings.webhook_enabled:
+            startup_delay = 60  # seconds
+            logger.info(f"⏳ Production startup (polling mode): waiting {startup_delay}s for clean deployment...")
+            await asyncio.sleep(startup_delay)
+            logger.info("✅ Startup delay complete, proceeding with initialization")
+
+    async def _start_webhook_mode(self) -> None:
+        """Start the webhook server and register the webhook with Telegram."""
+        logger.info("="*60)
+        logger.info("Starting in WEBHOOK mode")
+        logger.info("="*60)
+
+        # Create webhook server with the application instance
+        self.webhook_server = WebhookServer(
+            application=self.application,
+            settings=self.settings,
+            text_message_callback=self.message_collector.handle_message
+        )
+
+        # Start webhook HTTP server
+        await self.webhook_server.start()
+
+        # Register webhook with Telegram
+        await self.bot_service.setup_webhook(
+            webhook_url=self.settings.webhook_url,
+            secret_token=self.settings.webhook_secret_token
+        )
+
+        logger.info("="*60)
+        logger.info("Bot is now running in WEBHOOK mode!")
+        logger.info("Press Ctrl+C to stop")
+        logger.info("="*60)
+
+    async def _start_polling_mode(self) -> None:
+        """Start polling, retrying while a previous instance still holds the connection."""
+        logger.info("="*60)
+        logger.info("Starting in POLLING mode (development)")
+        logger.info("="*60)
+
+        # Retry polling start to handle temporary conflicts during deployment
+        max_retries = 5
+        retry_delay = 10  # seconds
+
+        for attempt in range(max_retries):
+            try:
+                await self.application.updater.start_polling(
+                    allowed_updates=Update.ALL_TYPES,
+                    drop_pending_updates=True
+                )
+                logger.info("✅ Bot polling started successfully")
+                break
+            except Exception as e:
+                if "Conflict" in str(e) and attempt < max_retries - 1:
+                    logger.warning(
+                        f"⚠️ Conflict detected during polling start (attempt {attempt + 1}/{max_retries}). "
+                        f"Previous bot instance still active. Retrying in {retry_delay}s..."
+                    )
+                    await asyncio.sleep(retry_delay)
+                    retry_delay *= 1.5  # Exponential backoff
+                else:
+                    raise
+
+        logger.info("="*60)
+        logger.info("Bot is now running in POLLING mode!")
+        logger.info("Press Ctrl+C to stop")
+        logger.info("="*60)
+
     async def _keep_running(self) -> None:
         """Keep the bot running until stopped."""
         try:
@@ -293,7 +314,15 @@ async def main():
         await app.stop()
 
 
+def install_event_loop_policy() -> None:
+    """Use the libuv-based uvloop event loop when it is installed."""
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    install_event_loop_policy()
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -64,15 +64,23 @@ class Message(Base, TimestampMixin):
     def get_reactions(self) -> dict:
         """Get reactions as dictionary.
 
+        The decoded dictionary is cached per instance until the stored JSON
+        changes, so callers must treat it as read-only.
+
         Returns:
             Dictionary of emoji reactions or empty dict
         """
         if not self.reactions:
             return {}
+        cached = getattr(self, "_reactions_cache", None)
+        if cached is not None and cached[0] is self.reactions:
+            return cached[1]
         try:
-            return json.loads(self.reactions)
+            decoded = json.loads(self.reactions)
         except json.JSONDecodeError:
-            return {}
+            decoded = {}
+        self._reactions_cache = (self.reactions, decoded)
+        return decoded
 
     def __repr__(self) -> str:
         """String representation of Message."""
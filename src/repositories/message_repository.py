@@ -5,12 +5,22 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from sqlalchemy import Row, and_, desc
 
 from src.models.message import Message
 
 logger = logging.getLogger(__name__)
 
+# Columns needed to build analysis prompts; selected as plain rows so the
+# analyzer does not pay for ORM instance hydration
+ANALYSIS_COLUMNS = (
+    Message.message_id,
+    Message.user_id,
+    Message.user_name,
+    Message.text,
+    Message.timestamp,
+)
+
 
 class MessageRepository:
     """Repository for Message entity operations.
@@ -57,6 +67,22 @@ class MessageRepository:
 
         return message
 
+    def save_messages(self, messages: List[Message]) -> List[Message]:
+        """Save several messages in a single transaction.
+
+        Args:
+            messages: Message entities to save
+
+        Returns:
+            Saved messages with IDs assigned
+        """
+        self.session.add_all(messages)
+        self.session.commit()
+
+        logger.debug(f"Saved {len(messages)} messages")
+
+        return messages
+
     def get_messages_last_24h(self, chat_id: int) -> List[Message]:
         """Get all messages from the last 24 hours for a chat.
 
@@ -89,6 +115,62 @@ class MessageRepository:
 
         return messages
 
+    def get_messages_since(
+        self, chat_id: int, since: datetime
+    ) -> List[Row]:
+        """Get all messages for a chat sent at or after a point in time.
+
+        Uses index idx_chat_timestamp for efficient querying. Only
+        ANALYSIS_COLUMNS are selected, as rows rather than Message instances.
+
+        Args:
+            chat_id: Telegram chat ID
+            since: Earliest message timestamp to include
+
+        Returns:
+            List of message rows ordered by timestamp ascending
+        """
+        return (
+            self.session.query(*ANALYSIS_COLUMNS)
+            .filter(
+                and_(
+                    Message.chat_id == chat_id,
+                    Message.timestamp >= since
+                )
+            )
+            .order_by(Message.timestamp)
+            .all()
+        )
+
+    def get_messages_between(
+        self, chat_id: int, start_time: datetime, end_time: datetime
+    ) -> List[Row]:
+        """Get all messages for a chat within a time period.
+
+        Uses index idx_chat_timestamp for efficient querying. Only
+        ANALYSIS_COLUMNS are selected, as rows rather than Message instances.
+
+        Args:
+            chat_id: Telegram chat ID
+            start_time: Start of the period (inclusive)
+            end_time: End of the period (inclusive)
+
+        Returns:
+            List of message rows ordered by timestamp ascending
+        """
+        return (
+            self.session.query(*ANALYSIS_COLUMNS)
+            .filter(
+                and_(
+                    Message.chat_id == chat_id,
+                    Message.timestamp >= start_time,
+                    Message.timestamp <= end_time
+                )
+            )
+            .order_by(Message.timestamp)
+            .all()
+        )
+
     def get_message_by_id(
         self, chat_id: int, message_id: int
     ) -> Optional[Message]:
@@ -130,10 +212,12 @@ class MessageRepository:
             cutoff = datetime.now() - timedelta(hours=48)
             deleted_count = repo.delete_old_messages(cutoff)
         """
+        # Single DELETE statement; the commit below expires any loaded
+        # instances, so there is no need to sync the identity map
         result = (
             self.session.query(Message)
             .filter(Message.timestamp < before_date)
-            .delete()
+            .delete(synchronize_session=False)
         )
 
         self.session.commit()
@@ -3,11 +3,16 @@
 import asyncio
 import json
 import logging
+import re
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Union
 
 from anthropic import Anthropic
+from anthropic.types import ContentBlock, MessageParam, TextBlock, TextBlockParam
+from anthropic.types.message_create_params import MessageCreateParamsNonStreaming
+from anthropic.types.messages.batch_create_params import Request
 from pydantic import BaseModel, Field
+from sqlalchemy.engine import Row
 
 from src.config.settings import Settings
 from src.models.message import Message
@@ -61,6 +66,73 @@ class AnalysisResult(BaseModel):
     summary: AnalysisSummary = Field(description="Summary statistics")
 
 
+# Messages accepted by the analysis entry points: full Message entities or
+# the column rows MessageRepository projects for the analyzer. Both expose
+# message_id, user_id, user_name, text and timestamp.
+AnalyzableMessage = Union[Message, Row]
+
+
+# Static analysis instructions, sent as the system prompt so the user turn
+# carries only the messages to analyze.
+ANALYSIS_SYSTEM_PROMPT = """Analyze the Telegram messages provided by the user and identify:
+
+1. **Questions**: Messages that ask for information or clarification
+   - Categorize each as: technical, business, or other
+   - Track message ID and text
+   - Note: Exclude rhetorical questions and pleasantries
+
+2. **Answers**: Messages that respond to questions
+   - Map each answer to the question it addresses (by message_id)
+   - Calculate response time from question to answer
+
+3. **Summary Statistics**:
+   - Total questions found
+   - Number answered vs unanswered
+   - Average response time
+
+**Important Guidelines:**
+- Be precise in identifying genuine questions (exclude rhetorical or casual remarks)
+- Map answers to questions based on context and timing
+- For multi-part questions, treat as single question unless clearly separate
+- Response time should be calculated from question timestamp to answer timestamp
+- If a question has multiple answers, use the first substantive answer
+
+**CRITICAL**: You MUST respond with ONLY valid JSON. Do not include any explanations, markdown formatting, or code blocks.
+
+Return your analysis in this exact JSON format:
+{
+  "questions": [
+    {
+      "message_id": 123,
+      "text": "question text",
+      "category": "technical|business|other",
+      "is_answered": true|false,
+      "answer_message_id": 124,
+      "response_time_minutes": 15.5
+    }
+  ],
+  "answers": [
+    {
+      "message_id": 124,
+      "text": "answer text",
+      "answers_to_message_id": 123
+    }
+  ],
+  "summary": {
+    "total_questions": 10,
+    "answered": 8,
+    "unanswered": 2,
+    "avg_response_time_minutes": 45.2
+  }
+}"""
+
+# No cache breakpoint: the instructions are below the model's minimum
+# cacheable prompt length, so caching them would never produce a hit
+SYSTEM_BLOCKS: List[TextBlockParam] = [
+    {"type": "text", "text": ANALYSIS_SYSTEM_PROMPT}
+]
+
+
 class ClaudeAPIService:
     """Service for interacting with Claude API for message analysis.
 
@@ -72,7 +144,6 @@ class ClaudeAPIService:
     MODEL = "claude-sonnet-4-20250514"  # Latest Claude Sonnet 4 model
     MAX_TOKENS = 4096
     BATCH_POLL_INTERVAL = 10  # seconds
-    BATCH_MAX_WAIT = 300  # 5 minutes
 
     def __init__(self, settings: Settings):
         """Initialize Claude API service.
@@ -91,8 +162,11 @@ class ClaudeAPIService:
         self.settings = settings
         self.client = Anthropic(api_key=settings.anthropic_api_key)
 
-    def _build_analysis_prompt(self, messages: List[Message]) -> str:
-        """Build prompt for Claude API analysis.
+    def _build_analysis_prompt(self, messages: Sequence[AnalyzableMessage]) -> str:
+        """Build the user prompt carrying the messages to analyze.
+
+        The analysis instructions live in ANALYSIS_SYSTEM_PROMPT so that the
+        per-call prompt holds only the messages.
 
         Args:
             messages: List of Telegram messages to analyze
@@ -111,67 +185,76 @@ class ClaudeAPIService:
 
         messages_block = "\n".join(messages_text)
 
-        prompt = f"""Analyze the following Telegram messages and identify:
+        return f"**Messages:**\n{messages_block}"
+
+    @staticmethod
+    def _empty_result() -> AnalysisResult:
+        """Build the analysis result returned for an empty message list."""
+        return AnalysisResult(
+            questions=[],
+            answers=[],
+            summary=AnalysisSummary(
+                total_questions=0,
+                answered=0,
+                unanswered=0,
+                avg_response_time_minutes=None,
+            ),
+        )
+
+    @staticmethod
+    def _response_text(content: List[ContentBlock]) -> str:
+        """Return the text of the first block in a model response.
 
-1. **Questions**: Messages that ask for information or clarification
-   - Categorize each as: technical, business, or other
-   - Track message ID and text
-   - Note: Exclude rhetorical questions and pleasantries
+        Args:
+            content: Content blocks of the model response
 
-2. **Answers**: Messages that respond to questions
-   - Map each answer to the question it addresses (by message_id)
-   - Calculate response time from question to answer
+        Returns:
+            Text of the first content block
 
-3. **Summary Statistics**:
-   - Total questions found
-   - Number answered vs unanswered
-   - Average response time
+        Raises:
+            Exception: If the first block is not a text block
+        """
+        block = content[0]
+        if not isinstance(block, TextBlock):
+            raise Exception(f"Expected a text block from Claude API, got {block.type}")
+        return block.text
 
-**Messages:**
-{messages_block}
+    def _parse_analysis_response(self, response_text: str) -> AnalysisResult:
+        """Parse and validate Claude's JSON analysis response.
 
-**Important Guidelines:**
-- Be precise in identifying genuine questions (exclude rhetorical or casual remarks)
-- Map answers to questions based on context and timing
-- For multi-part questions, treat as single question unless clearly separate
-- Response time should be calculated from question timestamp to answer timestamp
-- If a question has multiple answers, use the first substantive answer
+        Args:
+            response_text: Raw text content of the model response
 
-**CRITICAL**: You MUST respond with ONLY valid JSON. Do not include any explanations, markdown formatting, or code blocks.
+        Returns:
+            Validated AnalysisResult
 
-Return your analysis in this exact JSON format:
-{{
-  "questions": [
-    {{
-      "message_id": 123,
-      "text": "question text",
-      "category": "technical|business|other",
-      "is_answered": true|false,
-      "answer_message_id": 124,
-      "response_time_minutes": 15.5
-    }}
-  ],
-  "answers": [
-    {{
-      "message_id": 124,
-      "text": "answer text",
-      "answers_to_message_id": 123
-    }}
-  ],
-  "summary": {{
-    "total_questions": 10,
-    "answered": 8,
-    "unanswered": 2,
-    "avg_response_time_minutes": 45.2
-  }}
-}}"""
-        return prompt
+        Raises:
+            Exception: If the response is not valid JSON
+        """
+        logger.debug(f"Claude API raw response: {response_text[:500]}...")
+
+        # Handle case where response might be wrapped in markdown code blocks
+        if response_text.strip().startswith("```"):
+            json_match = re.search(r'```(?:json)?\s*(\{.*\})\s*```', response_text, re.DOTALL)
+            if json_match:
+                response_text = json_match.group(1)
 
-    async def analyze_messages(self, messages: List[Message]) -> AnalysisResult:
+        try:
+            result_data = json.loads(response_text)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse Claude API response: {e}")
+            logger.error(f"Response text: {response_text}")
+            raise Exception(f"Invalid JSON response from Claude API: {e}")
+
+        return AnalysisResult(**result_data)
+
+    async def analyze_messages(
+        self, messages: Sequence[AnalyzableMessage]
+    ) -> AnalysisResult:
         """Analyze messages using Claude API (async).
 
-        Currently uses standard Messages API.
-        TODO: Implement Message Batches for 50% cost savings.
+        Uses the standard Messages API; see analyze_messages_batch for
+        analyzing several message lists at batch pricing.
 
         Args:
             messages: List of messages to analyze
@@ -184,16 +267,7 @@ Return your analysis in this exact JSON format:
         """
         if not messages:
             # Return empty result for no messages
-            return AnalysisResult(
-                questions=[],
-                answers=[],
-                summary=AnalysisSummary(
-                    total_questions=0,
-                    answered=0,
-                    unanswered=0,
-                    avg_response_time_minutes=None,
-                ),
-            )
+            return self._empty_result()
 
         logger.info(f"🤖 Analyzing {len(messages)} messages with Claude API")
         logger.debug(f"Using model: {self.MODEL}, max_tokens: {self.MAX_TOKENS}")
@@ -210,26 +284,15 @@ Return your analysis in this exact JSON format:
                 self.client.messages.create,
                 model=self.MODEL,
                 max_tokens=self.MAX_TOKENS,
-                messages=[{"role": "user", "content": prompt}],
+                system=SYSTEM_BLOCKS,
+                messages=[MessageParam(role="user", content=prompt)],
             )
             logger.debug(f"✅ Claude API response received")
 
-            # Extract JSON from response
-            response_text = response.content[0].text
-
-            logger.debug(f"Claude API raw response: {response_text[:500]}...")
-
             # Parse and validate response
-            # Handle case where response might be wrapped in markdown code blocks
-            if response_text.strip().startswith("```"):
-                # Extract JSON from markdown code block
-                import re
-                json_match = re.search(r'```(?:json)?\s*(\{.*\})\s*```', response_text, re.DOTALL)
-                if json_match:
-                    response_text = json_match.group(1)
-
-            result_data = json.loads(response_text)
-            result = AnalysisResult(**result_data)
+            result = self._parse_analysis_response(
+                self._response_text(response.content)
+            )
 
             logger.info(
                 f"Analysis complete: {result.summary.total_questions} questions, "
@@ -239,31 +302,91 @@ Return your analysis in this exact JSON format:
 
             return result
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Claude API response: {e}")
-            logger.error(f"Response text: {response_text}")
-            raise Exception(f"Invalid JSON response from Claude API: {e}")
         except Exception as e:
             logger.error(f"Claude API call failed: {e}")
             raise
 
     async def analyze_messages_batch(
-        self, messages: List[Message]
-    ) -> AnalysisResult:
-        """Analyze messages using Message Batches API for 50% cost savings.
+        self, message_lists: Dict[str, Sequence[AnalyzableMessage]]
+    ) -> Dict[str, AnalysisResult]:
+        """Analyze several message lists in one Message Batches API job.
 
-        Creates a batch job, polls for completion, and retrieves results.
+        Each list becomes a separate batch request keyed by its custom_id.
+        Batch requests are billed at 50% of the standard price, at the cost
+        of asynchronous processing: the batch is polled every
+        BATCH_POLL_INTERVAL seconds for up to settings.claude_batch_max_wait
+        seconds.
 
         Args:
-            messages: List of messages to analyze
+            message_lists: Message lists to analyze, keyed by custom_id
 
         Returns:
-            AnalysisResult with questions, answers, and summary
+            Dictionary mapping each custom_id to its AnalysisResult
 
         Raises:
-            ValueError: If API key is not configured
             Exception: If batch processing fails or times out
         """
-        # TODO: Implement Message Batches API
-        # For MVP, use standard API
-        return await self.analyze_messages(messages)
+        results = {
+            custom_id: self._empty_result()
+            for custom_id, messages in message_lists.items()
+            if not messages
+        }
+        requests = [
+            Request(
+                custom_id=custom_id,
+                params=MessageCreateParamsNonStreaming(
+                    model=self.MODEL,
+                    max_tokens=self.MAX_TOKENS,
+                    system=SYSTEM_BLOCKS,
+                    messages=[
+                        MessageParam(role="user", content=self._build_analysis_prompt(messages))
+                    ],
+                ),
+            )
+            for custom_id, messages in message_lists.items()
+            if messages
+        ]
+        if not requests:
+            return results
+
+        logger.info(f"🤖 Submitting batch of {len(requests)} analysis requests to Claude API")
+
+        batch = await asyncio.to_thread(
+            self.client.messages.batches.create, requests=requests
+        )
+        logger.debug(f"Batch {batch.id} created")
+
+        max_wait = self.settings.claude_batch_max_wait
+        waited = 0
+        while batch.processing_status != "ended":
+            if waited >= max_wait:
+                # Stop the job so unfinished requests are not processed and billed
+                await asyncio.to_thread(self.client.messages.batches.cancel, batch.id)
+                raise Exception(
+                    f"Batch {batch.id} did not finish within {max_wait}s"
+                )
+            await asyncio.sleep(self.BATCH_POLL_INTERVAL)
+            waited += self.BATCH_POLL_INTERVAL
+            batch = await asyncio.to_thread(
+                self.client.messages.batches.retrieve, batch.id
+            )
+
+        entries = await asyncio.to_thread(
+            lambda: list(self.client.messages.batches.results(batch.id))
+        )
+        for entry in entries:
+            if entry.result.type != "succeeded":
+                raise Exception(
+                    f"Batch request {entry.custom_id} {entry.result.type}"
+                )
+            results[entry.custom_id] = self._parse_analysis_response(
+                self._response_text(entry.result.message.content)
+            )
+
+        missing = message_lists.keys() - results.keys()
+        if missing:
+            raise Exception(f"Batch {batch.id} returned no results for {sorted(missing)}")
+
+        logger.info(f"Batch {batch.id} complete: {len(entries)} analyses")
+
+        return results
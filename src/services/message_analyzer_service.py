@@ -38,11 +38,14 @@ class MessageAnalyzerService:
         self.message_repo = MessageRepository(session)
         self.claude_service = ClaudeAPIService(settings)
 
-    async def analyze_chat_last_24h(self, chat_id: int) -> Optional[AnalysisResult]:
+    async def analyze_chat_last_24h(
+        self, chat_id: int, *, now: Optional[datetime] = None
+    ) -> Optional[AnalysisResult]:
         """Analyze messages from the last 24 hours for a chat.
 
         Args:
             chat_id: Internal database chat ID
+            now: End of the 24-hour window (defaults to the current UTC time)
 
         Returns:
             AnalysisResult with questions, answers, and summary, or None if no messages
@@ -53,7 +56,9 @@ class MessageAnalyzerService:
         logger.info(f"Starting 24h analysis for chat_id={chat_id}")
 
         # Fetch messages from last 24 hours
-        since = datetime.now(timezone.utc) - timedelta(hours=24)
+        if now is None:
+            now = datetime.now(timezone.utc)
+        since = now - timedelta(hours=24)
         messages = self.message_repo.get_messages_since(chat_id, since)
 
         if not messages:
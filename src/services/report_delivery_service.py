@@ -3,7 +3,7 @@
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from sqlalchemy.orm import Session
 from telegram import Bot
@@ -39,6 +39,10 @@ class ReportDeliveryService:
     MAX_MESSAGE_LENGTH = 4096  # Telegram message limit
     RETRY_DELAY_SECONDS = 60  # Delay before retry on error
     MAX_RETRIES = 3
+    TRUNCATE_MARKER = "\n\n_[Report truncated due to length limit]_"
+
+    # All delays go through this hook so tests can skip real waiting
+    _sleep = staticmethod(asyncio.sleep)
 
     def __init__(self, settings: Optional[Settings] = None):
         """Initialize report delivery service.
@@ -135,7 +139,7 @@ class ReportDeliveryService:
                 # Rate limiting: stagger requests
                 if i < len(enabled_chats) - 1:  # Don't delay after last chat
                     logger.debug(f"Waiting {self.STAGGER_DELAY_SECONDS}s before next chat")
-                    await asyncio.sleep(self.STAGGER_DELAY_SECONDS)
+                    await self._sleep(self.STAGGER_DELAY_SECONDS)
 
         # Log summary
         duration = (datetime.now(timezone.utc) - start_time).total_seconds()
@@ -227,6 +231,10 @@ class ReportDeliveryService:
     def _format_report(self, analysis: AnalysisResult, chat_name: str) -> str:
         """Format analysis result as Telegram message.
 
+        Lines are rendered lazily and assembly stops as soon as the report
+        exceeds MAX_MESSAGE_LENGTH, so an oversized analysis is never
+        rendered in full just to be truncated.
+
         Args:
             analysis: Analysis result from Claude API
             chat_name: Name of the chat for header
@@ -234,8 +242,40 @@ class ReportDeliveryService:
         Returns:
             str: Formatted Telegram message with Markdown
         """
+        report_lines = []
+        report_length = -1  # No newline before the first line
+
+        for line in self._iter_report_lines(analysis, chat_name):
+            report_lines.append(line)
+            report_length += len(line) + 1
+
+            # Handle message length limit
+            if report_length > self.MAX_MESSAGE_LENGTH:
+                logger.warning(
+                    f"Report exceeds Telegram limit ({self.MAX_MESSAGE_LENGTH}). "
+                    "Truncating..."
+                )
+                max_len = self.MAX_MESSAGE_LENGTH - len(self.TRUNCATE_MARKER)
+                return "\n".join(report_lines)[:max_len] + self.TRUNCATE_MARKER
+
+        return "\n".join(report_lines)
+
+    def _iter_report_lines(
+        self,
+        analysis: AnalysisResult,
+        chat_name: str
+    ) -> Iterator[str]:
+        """Yield the lines of a formatted report in order.
+
+        Args:
+            analysis: Analysis result from Claude API
+            chat_name: Name of the chat for header
+
+        Yields:
+            str: Report lines without trailing newlines
+        """
         # Build header
-        report_lines = [
+        yield from (
             "📊 *Daily Communication Report* #IMFReport",
             f"Chat: {chat_name}",
             f"Period: Last 24 hours",
@@ -243,60 +283,42 @@ class ReportDeliveryService:
             "",
             "━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
             "",
-        ]
+        )
 
         # Summary section
-        report_lines.extend([
+        yield from (
             "📈 *Summary*",
             f"• Total Questions: {analysis.summary.total_questions}",
             f"• Answered: {analysis.summary.answered}",
             f"• Unanswered: {analysis.summary.unanswered}",
-        ])
+        )
 
         if analysis.summary.avg_response_time_minutes:
-            report_lines.append(
-                f"• Avg Response Time: {analysis.summary.avg_response_time_minutes:.1f} minutes"
-            )
+            yield f"• Avg Response Time: {analysis.summary.avg_response_time_minutes:.1f} minutes"
 
-        report_lines.extend(["", "━━━━━━━━━━━━━━━━━━━━━━━━━━━━", ""])
+        yield from ("", "━━━━━━━━━━━━━━━━━━━━━━━━━━━━", "")
 
         # Questions section
         if analysis.questions:
-            report_lines.append("❓ *Questions Identified*")
-            report_lines.append("")
+            yield "❓ *Questions Identified*"
+            yield ""
 
             for i, q in enumerate(analysis.questions, 1):
                 status = "✅ Answered" if q.is_answered else "⏳ Pending"
-                report_lines.append(f"{i}. {status} | {q.category.upper()}")
-                report_lines.append(f"   _{q.text}_")
+                yield f"{i}. {status} | {q.category.upper()}"
+                yield f"   _{q.text}_"
 
                 if q.is_answered and q.response_time_minutes:
-                    report_lines.append(
-                        f"   Response time: {q.response_time_minutes:.1f} min"
-                    )
+                    yield f"   Response time: {q.response_time_minutes:.1f} min"
 
-                report_lines.append("")
+                yield ""
 
         # Footer
-        report_lines.extend([
+        yield from (
             "━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
             "",
             "_This report was generated automatically by IMF Bot_",
-        ])
-
-        report_text = "\n".join(report_lines)
-
-        # Handle message length limit
-        if len(report_text) > self.MAX_MESSAGE_LENGTH:
-            logger.warning(
-                f"Report exceeds Telegram limit ({len(report_text)} > {self.MAX_MESSAGE_LENGTH}). "
-                "Truncating..."
-            )
-            truncate_marker = "\n\n_[Report truncated due to length limit]_"
-            max_len = self.MAX_MESSAGE_LENGTH - len(truncate_marker)
-            report_text = report_text[:max_len] + truncate_marker
-
-        return report_text
+        )
 
     async def _send_telegram_report(
         self,
@@ -329,7 +351,7 @@ class ReportDeliveryService:
                     f"Rate limit hit for chat {chat_id}. "
                     f"Waiting {wait_seconds}s (attempt {attempt+1}/{self.MAX_RETRIES})"
                 )
-                await asyncio.sleep(wait_seconds)
+                await self._sleep(wait_seconds)
 
             except TelegramError as e:
                 logger.error(
@@ -338,7 +360,7 @@ class ReportDeliveryService:
                 )
 
                 if attempt < self.MAX_RETRIES - 1:
-                    await asyncio.sleep(self.RETRY_DELAY_SECONDS)
+                    await self._sleep(self.RETRY_DELAY_SECONDS)
 
             except Exception as e:
                 logger.error(
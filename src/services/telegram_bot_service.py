@@ -41,9 +41,14 @@ class TelegramBotService:
         """
         logger.info("Creating Telegram bot application...")
 
+        # Reuse pooled HTTP/2 connections to api.telegram.org for outbound
+        # calls instead of paying a TLS handshake per connection
         application = (
             ApplicationBuilder()
             .token(self.settings.telegram_bot_token)
+            .http_version("2")
+            .connection_pool_size(self.settings.bot_connection_pool_size)
+            .pool_timeout(5.0)
             .build()
         )
 
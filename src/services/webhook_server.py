@@ -13,6 +13,7 @@ import hmac
 import ipaddress
 import json
 import logging
+import socket
 from typing import Callable, Optional
 
 from aiohttp import web
@@ -35,7 +36,7 @@ class WebhookServer:
     Attributes:
         app: aiohttp web application
         runner: aiohttp web runner
-        site: aiohttp TCP site
+        site: aiohttp socket site
         port: HTTP server port
         webhook_path: URL path for webhook endpoint
         secret_token: Secret token for request validation
@@ -48,11 +49,18 @@ class WebhookServer:
         "91.108.4.0/22",     # Telegram servers (EU)
     ]
 
+    # Precomputed health check response body
+    HEALTH_BODY = b"OK"
+
+    # Maximum accepted request body size in bytes
+    MAX_REQUEST_SIZE = 256 * 1024
+
     def __init__(
         self,
         application: Application,
         settings: Settings,
-        webhook_path: str = "/webhook"
+        webhook_path: str = "/webhook",
+        text_message_callback: Optional[Callable] = None
     ):
         """Initialize webhook server.
 
@@ -60,21 +68,31 @@ class WebhookServer:
             application: Telegram Application instance for update processing
             settings: Application settings with configuration
             webhook_path: URL path for webhook endpoint (default: /webhook)
+            text_message_callback: Optional async callback for plain text
+                messages, invoked directly instead of through the handler stack
         """
         self.application = application
+        self.text_message_callback = text_message_callback
         self.settings = settings
         self.webhook_path = webhook_path
         self.secret_token = settings.webhook_secret_token
+        self._secret_token_bytes = (
+            self.secret_token.encode("utf-8") if self.secret_token else None
+        )
         self.port = settings.webhook_port
 
         # aiohttp components
         self.app: Optional[web.Application] = None
         self.runner: Optional[web.AppRunner] = None
-        self.site: Optional[web.TCPSite] = None
+        self.site: Optional[web.SockSite] = None
 
-        # Precompute IP networks for validation
-        self._telegram_networks = [
-            ipaddress.ip_network(net) for net in self.TELEGRAM_IP_RANGES
+        # Bound concurrent update processing to apply backpressure under bursts
+        self._update_semaphore = asyncio.Semaphore(settings.max_concurrent_updates)
+
+        # Precompute IP networks for validation as (network, netmask) integers
+        self._telegram_masks = [
+            (int(net.network_address), int(net.netmask))
+            for net in map(ipaddress.ip_network, self.TELEGRAM_IP_RANGES)
         ]
 
     def _is_telegram_ip(self, ip_address: str) -> bool:
@@ -88,11 +106,60 @@ class WebhookServer:
         """
         try:
             ip = ipaddress.ip_address(ip_address)
-            return any(ip in network for network in self._telegram_networks)
         except ValueError:
             logger.error(f"Invalid IP address format: {ip_address}")
             return False
 
+        # Telegram ranges are IPv4-only
+        if ip.version != 4:
+            return False
+
+        ip_int = int(ip)
+        for network, mask in self._telegram_masks:
+            if ip_int & mask == network:
+                return True
+        return False
+
+    @staticmethod
+    def _is_plain_text_message(update: Update) -> bool:
+        """Check if update is a non-command text message.
+
+        Args:
+            update: Parsed Telegram update
+
+        Returns:
+            True if update carries message text that is not a command
+        """
+        message = update.message
+        if message is None:
+            return False
+        text = message.text
+        return bool(text and not text.startswith("/"))
+
+    async def _process_update(self, update: Update) -> None:
+        """Process a Telegram update once a concurrency slot is available.
+
+        Plain text messages go straight to the text message callback when
+        one is configured; commands and other update types are routed
+        through the full handler stack. Errors raised by the callback are
+        dispatched to the application's error handlers, as process_update
+        would do.
+
+        Args:
+            update: Parsed Telegram update
+        """
+        async with self._update_semaphore:
+            if self.text_message_callback and self._is_plain_text_message(update):
+                context = self.application.context_types.context.from_update(
+                    update, self.application
+                )
+                try:
+                    await self.text_message_callback(update, context)
+                except Exception as e:
+                    await self.application.process_error(update=update, error=e)
+            else:
+                await self.application.process_update(update)
+
     def _validate_secret_token(self, request: web.Request) -> bool:
         """Validate X-Telegram-Bot-Api-Secret-Token header.
 
@@ -102,9 +169,7 @@ class WebhookServer:
         Returns:
             True if token matches, False otherwise
         """
-        token = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "")
-
-        if not self.secret_token:
+        if self._secret_token_bytes is None:
             # No secret token configured - warn and allow (for local testing)
             logger.warning(
                 "No WEBHOOK_SECRET_TOKEN configured. "
@@ -112,8 +177,10 @@ class WebhookServer:
             )
             return True
 
+        token = request.headers.get("X-Telegram-Bot-Api-Secret-Token", "")
+
         # Constant-time comparison to prevent timing attacks
-        return hmac.compare_digest(token, self.secret_token)
+        return hmac.compare_digest(token.encode("utf-8"), self._secret_token_bytes)
 
     async def handle_webhook(self, request: web.Request) -> web.Response:
         """Handle incoming webhook POST request from Telegram.
@@ -175,9 +242,7 @@ class WebhookServer:
 
             # Process update through bot handlers
             # This is async, so we don't wait for completion
-            asyncio.create_task(
-                self.application.process_update(update)
-            )
+            asyncio.create_task(self._process_update(update))
 
             # Telegram expects 200 OK quickly (within 1 second)
             return web.Response(status=200, text="OK")
@@ -196,7 +261,32 @@ class WebhookServer:
         Returns:
             HTTP 200 OK if server is healthy
         """
-        return web.Response(status=200, text="OK")
+        return web.Response(status=200, body=self.HEALTH_BODY)
+
+    def _create_listen_socket(self) -> socket.socket:
+        """Create the listening socket for the webhook server.
+
+        Built by hand so SO_REUSEPORT can be set when webhook_reuse_port is
+        enabled.
+
+        Returns:
+            Bound, listening TCP socket
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if self.settings.webhook_reuse_port:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+
+            # Listen on all interfaces (required for Render)
+            sock.bind(("0.0.0.0", self.port))
+            sock.listen(128)
+            sock.setblocking(False)
+        except OSError:
+            sock.close()
+            raise
+
+        return sock
 
     async def start(self) -> None:
         """Start the webhook HTTP server.
@@ -207,22 +297,20 @@ class WebhookServer:
         logger.info(f"📍 Webhook endpoint: {self.webhook_path}")
         logger.info(f"🔐 Secret token: {'configured' if self.secret_token else 'NOT SET (insecure!)'}")
 
-        # Create aiohttp app
-        self.app = web.Application()
+        # Create aiohttp app (updates are small JSON payloads, so cap body size)
+        self.app = web.Application(client_max_size=self.MAX_REQUEST_SIZE)
 
-        # Register routes
-        self.app.router.add_post(self.webhook_path, self.handle_webhook)
-        self.app.router.add_get("/health", self.handle_health)
+        # Register all routes in one batch; AppRunner.setup() freezes the router
+        self.app.add_routes([
+            web.post(self.webhook_path, self.handle_webhook),
+            web.get("/health", self.handle_health),
+        ])
 
         # Start server
         self.runner = web.AppRunner(self.app)
         await self.runner.setup()
 
-        self.site = web.TCPSite(
-            self.runner,
-            host="0.0.0.0",  # Listen on all interfaces (required for Render)
-            port=self.port
-        )
+        self.site = web.SockSite(self.runner, self._create_listen_socket())
 
         await self.site.start()
 
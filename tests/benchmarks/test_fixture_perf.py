@@ -0,0 +1,21 @@
+"""Benchmarks for the accuracy dataset loaders.
+
+Run with: pytest tests/benchmarks -n 0 --dist=no --benchmark-only
+"""
+
+from tests.fixtures.test_messages_dataset import get_test_messages_with_questions
+
+# Upper bound for a single loader call; the dataset is built once at import
+# time, so anything slower means per-call work has crept back in.
+MAX_MEAN_SECONDS = 50e-6
+
+
+def test_messages_loader(benchmark):
+    """Test get_test_messages_with_questions stays a cheap cached lookup."""
+    messages = benchmark.pedantic(
+        get_test_messages_with_questions, rounds=1000, iterations=1
+    )
+
+    assert len(messages) == 25
+    if benchmark.stats is not None:  # None when disabled (e.g. under xdist)
+        assert benchmark.stats.stats.mean < MAX_MEAN_SECONDS
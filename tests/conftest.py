@@ -1,50 +1,325 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
 import pytest
 import os
-from datetime import datetime
+import json
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta, timezone
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
+from src.config.database import get_session_factory
 from src.models.base import Base
 from src.models.message import Message
 from src.models.chat import Chat
+from src.repositories.chat_repository import ChatRepository
+from src.repositories.message_repository import MessageRepository
+from src.config.settings import Settings
+from src.services.claude_api_service import ClaudeAPIService
+from src.services.message_collector_service import MessageCollectorService
+from tests.fixtures.test_messages_dataset import (
+    get_test_messages_with_questions,
+    get_test_qa_pairs,
+    to_datetime,
+)
 
 # Load environment variables for integration tests
 load_dotenv()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
+def event_loop():
+    """Share one event loop across each test module.
+
+    Overrides pytest-asyncio's function-scoped loop so async tests and
+    module-scoped async fixtures in a module run on the same loop.
+
+    Yields:
+        Event loop for the current module
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_database_url(tmp_path_factory, worker_id):
+    """Point file-backed databases at a per-worker SQLite file.
+
+    Tests that go through get_settings() (e.g. get_engine()) would otherwise
+    share ./bot_data.db across pytest-xdist workers.
+
+    Args:
+        tmp_path_factory: Pytest temporary directory factory
+        worker_id: pytest-xdist worker ID ("master" when not distributed)
+
+    Yields:
+        The per-worker database URL
+    """
+    database_url = f"sqlite:///{tmp_path_factory.mktemp(worker_id) / 'bot_data.db'}"
+    mp = pytest.MonkeyPatch()
+    mp.setenv("DATABASE_URL", database_url)
+    yield database_url
+    mp.undo()
+
+
+@pytest.fixture(autouse=True)
+def clear_session_factory_cache():
+    """Drop the cached session factory after each test.
+
+    get_session_factory() is lru_cached, so a factory bound to one test's
+    engine or settings would otherwise be reused by later tests.
+    """
+    yield
+    get_session_factory.cache_clear()
+
+
+@pytest.fixture(scope="class")
 def db_engine():
-    """Create in-memory SQLite engine for testing.
+    """Create in-memory SQLite engine shared by the tests of a class.
 
     Yields:
         SQLAlchemy engine instance
     """
-    engine = create_engine("sqlite:///:memory:")
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
     Base.metadata.create_all(engine)
     yield engine
     Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def shared_db_engine():
+    """Create one in-memory SQLite engine with the schema for the whole session.
+
+    StaticPool keeps a single connection so every session sees the same
+    in-memory database. pysqlite's implicit transaction handling is disabled
+    so SAVEPOINTs used by db_session behave correctly, and durability pragmas
+    are relaxed since the database never outlives the run.
+
+    Yields:
+        SQLAlchemy engine instance
+    """
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # Throwaway database: skip journal and sync work on every commit
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    _warm_statement_cache(engine)
+    yield engine
+    engine.dispose()
+
+
+@contextmanager
+def _transactional_session(engine):
+    """Open a session whose work is rolled back when the context exits.
+
+    The session runs inside an outer transaction; commits made by
+    repositories only release a SAVEPOINT.
+
+    Args:
+        engine: Database engine to connect to
+
+    Yields:
+        SQLAlchemy session
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+def _warm_statement_cache(engine):
+    """Compile the MessageRepository queries once against an empty database.
+
+    SQLAlchemy caches compiled statements per engine, so repository tests
+    sharing the engine skip SQL compilation on their first query.
+
+    Args:
+        engine: Database engine whose statement cache to populate
+    """
+    now = datetime.now(timezone.utc)
+    with _transactional_session(engine) as session:
+        repo = MessageRepository(session)
+        repo.count_messages()
+        repo.count_messages(chat_id=0)
+        repo.get_message_by_id(0, 0)
+        repo.get_messages_last_24h(0)
+        repo.get_messages_since(0, now - timedelta(hours=24))
+        repo.get_messages_between(0, now - timedelta(hours=24), now)
+        repo.delete_old_messages(now)
 
 
 @pytest.fixture(scope="function")
-def db_session(db_engine):
+def db_session(shared_db_engine):
     """Create database session for testing.
 
     Args:
-        db_engine: Database engine fixture
+        shared_db_engine: Session-scoped database engine fixture
 
     Yields:
-        SQLAlchemy session
+        SQLAlchemy session rolled back after the test
     """
-    SessionLocal = sessionmaker(bind=db_engine)
-    session = SessionLocal()
+    with _transactional_session(shared_db_engine) as session:
+        yield session
+
 
-    yield session
+@pytest.fixture(scope="class")
+def class_db_session(shared_db_engine):
+    """Create database session shared by every test in a class.
 
-    session.rollback()
-    session.close()
+    Args:
+        shared_db_engine: Session-scoped database engine fixture
+
+    Yields:
+        SQLAlchemy session rolled back after the class
+    """
+    with _transactional_session(shared_db_engine) as session:
+        yield session
+
+
+@pytest.fixture
+def seed_messages(db_session):
+    """Bulk-insert message rows without building ORM instances.
+
+    Args:
+        db_session: Database session fixture
+
+    Returns:
+        Function taking a list of MessageRow records to insert
+    """
+    def _seed(rows):
+        db_session.execute(insert(Message), [row.as_mapping() for row in rows])
+        db_session.commit()
+
+    return _seed
+
+
+@pytest.fixture
+def executed_statements(db_session):
+    """Record SQL statements executed through the test session.
+
+    Args:
+        db_session: Database session fixture
+
+    Yields:
+        List of (statement, parameters) tuples, appended as queries run
+    """
+    connection = db_session.connection()
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", _record)
+    yield statements
+    event.remove(connection, "before_cursor_execute", _record)
+
+
+# Field values for sample model fixtures, built once per session.
+# Fixtures still return fresh instances because tests attach them to sessions.
+SAMPLE_TIMESTAMP = datetime.now()
+
+SAMPLE_CHAT_FIELDS = {
+    "chat_id": 12345678,
+    "chat_name": "Test Chat",
+    "enabled": True,
+}
+
+SAMPLE_MESSAGE_FIELDS = {
+    "chat_id": 12345678,
+    "message_id": 100,
+    "user_id": 999,
+    "user_name": "Test User",
+    "text": "Hello, this is a test message!",
+    "timestamp": SAMPLE_TIMESTAMP,
+}
+
+SAMPLE_REACTIONS = {"❤️": 5, "👍": 3, "💩": 1}
+
+SAMPLE_MESSAGE_WITH_REACTIONS_FIELDS = {
+    **SAMPLE_MESSAGE_FIELDS,
+    "message_id": 101,
+    "text": "Message with reactions",
+    "reactions": json.dumps(SAMPLE_REACTIONS),
+}
+
+
+@pytest.fixture
+def patch_db_session(monkeypatch, db_session):
+    """Route get_db_session() in handlers and collector to the test session.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+        db_session: Database session fixture
+
+    Returns:
+        The patched-in database session
+    """
+    # nullcontext yields the test session without committing or closing it
+    session_context = nullcontext(db_session)
+    monkeypatch.setattr(
+        'src.handlers.admin_commands.get_db_session',
+        lambda: session_context
+    )
+    monkeypatch.setattr(
+        'src.services.message_collector_service.get_db_session',
+        lambda: session_context
+    )
+    return db_session
+
+
+@pytest.fixture(scope="session")
+def message_collector():
+    """Provide a MessageCollectorService shared across the session.
+
+    The service holds no per-test state; sessions come from get_db_session().
+
+    Returns:
+        MessageCollectorService instance
+    """
+    return MessageCollectorService()
+
+
+@pytest.fixture
+def chat_repo(db_session):
+    """Create a ChatRepository bound to the test session.
+
+    Args:
+        db_session: Database session fixture
+
+    Returns:
+        ChatRepository instance
+    """
+    return ChatRepository(db_session)
 
 
 @pytest.fixture
@@ -54,11 +329,7 @@ def sample_chat():
     Returns:
         Chat instance
     """
-    return Chat(
-        chat_id=12345678,
-        chat_name="Test Chat",
-        enabled=True
-    )
+    return Chat(**SAMPLE_CHAT_FIELDS)
 
 
 @pytest.fixture
@@ -68,14 +339,7 @@ def sample_message():
     Returns:
         Message instance
     """
-    return Message(
-        chat_id=12345678,
-        message_id=100,
-        user_id=999,
-        user_name="Test User",
-        text="Hello, this is a test message!",
-        timestamp=datetime.now()
-    )
+    return Message(**SAMPLE_MESSAGE_FIELDS)
 
 
 @pytest.fixture
@@ -85,13 +349,127 @@ def sample_message_with_reactions():
     Returns:
         Message instance with reactions
     """
-    message = Message(
-        chat_id=12345678,
-        message_id=101,
-        user_id=999,
-        user_name="Test User",
-        text="Message with reactions",
-        timestamp=datetime.now()
+    return Message(**SAMPLE_MESSAGE_WITH_REACTIONS_FIELDS)
+
+
+@pytest.fixture(scope="session")
+def question_dataset():
+    """Provide the question detection dataset (AC-002), built once per session.
+
+    Returns:
+        Tuple of question and non-question records sorted by timestamp
+    """
+    return get_test_messages_with_questions()
+
+
+@pytest.fixture(scope="session")
+def qa_pairs_dataset():
+    """Provide the answer mapping dataset (AC-003), built once per session.
+
+    Returns:
+        Tuple of known Q&A pair records
+    """
+    return get_test_qa_pairs()
+
+
+def _question_detection_messages(dataset):
+    """Convert the AC-002 dataset into Message objects expected by the analyzer."""
+    return [
+        Message(
+            chat_id=123,
+            message_id=msg.message_id,
+            user_id=1,
+            user_name="test_user",
+            text=msg.text,
+            timestamp=msg.timestamp
+        )
+        for msg in dataset
+    ]
+
+
+def _answer_mapping_messages(qa_pairs):
+    """Convert the AC-003 Q&A pairs into Message objects sorted by timestamp."""
+    messages = []
+    for pair in qa_pairs:
+        messages.append(Message(
+            chat_id=123,
+            message_id=pair.question_id,
+            user_id=1,
+            user_name="user_a",
+            text=pair.question_text,
+            timestamp=to_datetime(pair.question_ts)
+        ))
+        messages.append(Message(
+            chat_id=123,
+            message_id=pair.answer_id,
+            user_id=2,
+            user_name="user_b",
+            text=pair.answer_text,
+            timestamp=to_datetime(pair.answer_ts)
+        ))
+    return sorted(messages, key=lambda x: x.timestamp)
+
+
+# Client-side request budget for real Claude API tests
+CLAUDE_API_MAX_RATE = 5  # requests per CLAUDE_API_TIME_PERIOD
+CLAUDE_API_TIME_PERIOD = 60  # seconds
+
+
+@pytest.fixture(scope="session")
+def claude_settings():
+    """Provide Settings for real Claude API tests, built once per session.
+
+    Returns:
+        Settings populated from ANTHROPIC_API_KEY and TELEGRAM_BOT_TOKEN
+    """
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
+    if not api_key:
+        pytest.skip("ANTHROPIC_API_KEY not set - skipping real API tests")
+    if not bot_token:
+        pytest.skip("TELEGRAM_BOT_TOKEN not set - skipping real API tests")
+
+    return Settings(
+        telegram_bot_token=bot_token,
+        anthropic_api_key=api_key
     )
-    message.set_reactions({"❤️": 5, "👍": 3, "💩": 1})
-    return message
+
+
+@pytest.fixture(scope="session")
+def claude_service(claude_settings):
+    """Provide a ClaudeAPIService shared across the session.
+
+    The service holds no per-test state, so its Anthropic client and HTTP
+    connection pool are reused by every real API test. analyze_messages is
+    throttled client-side so back-to-back tests stay under the API rate
+    limit instead of tripping 429 retry back-off.
+
+    Returns:
+        ClaudeAPIService instance
+    """
+    service = ClaudeAPIService(settings=claude_settings)
+    limiter = AsyncLimiter(CLAUDE_API_MAX_RATE, CLAUDE_API_TIME_PERIOD)
+
+    async def throttled_analyze_messages(messages):
+        async with limiter:
+            # Resolved per call so class-level patches still apply
+            return await ClaudeAPIService.analyze_messages(service, messages)
+
+    service.analyze_messages = throttled_analyze_messages
+    return service
+
+
+@pytest.fixture(scope="session")
+def accuracy_analysis_results(claude_service, question_dataset, qa_pairs_dataset):
+    """Analyze the AC-002 and AC-003 datasets in one Message Batches job.
+
+    Both payloads go to Claude as a single batch, which is polled once
+    and billed at batch pricing; tests read their result by custom_id.
+
+    Returns:
+        Dictionary mapping "AC-002"/"AC-003" to AnalysisResult
+    """
+    return asyncio.run(claude_service.analyze_messages_batch({
+        "AC-002": _question_detection_messages(question_dataset),
+        "AC-003": _answer_mapping_messages(qa_pairs_dataset),
+    }))
@@ -0,0 +1,22 @@
+"""
+Lightweight message records for seeding the messages table in tests
+"""
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict
+
+
+@dataclass(frozen=True, slots=True)
+class MessageRow:
+    """Column values for one row of the messages table."""
+
+    chat_id: int
+    message_id: int
+    text: str
+    timestamp: datetime
+    user_id: int = 1
+    user_name: str = "User 1"
+
+    def as_mapping(self) -> Dict[str, Any]:
+        """Column name to value mapping accepted by a bulk insert."""
+        return asdict(self)
@@ -1,82 +1,119 @@
 """Integration tests for admin chat whitelist management E2E workflows.
 
-These tests verify complete end-to-end scenarios:
+These tests verify the complete end-to-end whitelist lifecycle:
 1. Admin adds chat → Messages from that chat are collected
 2. Admin removes chat → Messages from that chat are ignored
 """
 
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 from src.handlers.admin_commands import add_chat_command, remove_chat_command
-from src.services.message_collector_service import MessageCollectorService
 from src.repositories.message_repository import MessageRepository
 from src.repositories.chat_repository import ChatRepository
 from src.config.settings import Settings
 
+# Shared scenario identifiers for the workflow
+ADMIN_USER_ID = 123456789
+TEST_CHAT_ID = -1001234567890
+TEST_CHAT_NAME = "Partner Channel"
+PARTNER_USER_ID = 999888777
+PARTNER_USER_NAME = "Partner User"
+
+# Frozen message timestamp keeps the workflows deterministic
+FIXED_NOW = datetime(2025, 10, 24, 12, 0, 0)
+
+# Settings are read-only for the admin handlers, so one instance is shared
+TEST_SETTINGS = Settings(
+    telegram_bot_token="test_token",
+    admin_user_id=ADMIN_USER_ID,
+    anthropic_api_key="test_key"
+)
+
+
+def make_message_update(chat_id, message_id, text, user_id, user_name, date=FIXED_NOW):
+    """Build a lightweight Telegram update carrying a text message.
+
+    Args:
+        chat_id: Telegram chat ID
+        message_id: Telegram message ID
+        text: Message text
+        user_id: Sender Telegram ID
+        user_name: Sender full name
+        date: Message timestamp (defaults to FIXED_NOW)
+
+    Returns:
+        Update stand-in with static message attributes
+    """
+    return SimpleNamespace(
+        message=SimpleNamespace(
+            chat_id=chat_id,
+            message_id=message_id,
+            text=text,
+            date=date,
+            from_user=SimpleNamespace(id=user_id, full_name=user_name),
+        )
+    )
+
+
+def make_admin_update(admin_id, args, settings):
+    """Build a lightweight update/context pair for an admin command.
+
+    Args:
+        admin_id: Telegram ID of the user issuing the command
+        args: Command arguments
+        settings: Settings stored in bot_data
 
-@pytest.mark.asyncio
+    Returns:
+        Tuple of (update, context) stand-ins; reply_text is an AsyncMock
+    """
+    update = SimpleNamespace(
+        effective_user=SimpleNamespace(id=admin_id),
+        message=SimpleNamespace(reply_text=AsyncMock()),
+    )
+    context = SimpleNamespace(args=args, bot_data={"settings": settings})
+    return update, context
+
+
+@pytest.mark.usefixtures("patch_db_session")
 class TestAdminChatWorkflow:
     """E2E integration tests for admin chat management workflows."""
 
-    async def test_admin_adds_chat_then_messages_collected(self, db_session):
-        """Test E2E: Admin adds chat to whitelist → Bot collects messages from it.
+    async def test_admin_chat_lifecycle(self, db_session, message_collector):
+        """Test E2E: Admin adds chat → messages collected → admin removes chat → messages ignored.
+
+        Both halves of the lifecycle run against one database session so the
+        whitelist scaffolding is set up and torn down once.
 
         Workflow:
         1. Admin executes /add_chat command with chat_id and name
         2. Chat is added to whitelist (enabled=True)
-        3. Message arrives from that chat
-        4. Bot collects and stores the message
+        3. Message from that chat is collected and stored
+        4. Admin executes /remove_chat command
+        5. Chat is disabled (enabled=False)
+        6. New message from same chat is ignored (not stored)
 
         Args:
             db_session: Database session fixture
+            message_collector: Shared message collector fixture
         """
-        # Step 1: Setup admin context and mock update
-        admin_user_id = 123456789
-        test_chat_id = -1001234567890
-        test_chat_name = "Partner Channel"
-
-        settings = Settings(
-            telegram_bot_token="test_token",
-            admin_user_id=admin_user_id,
-            anthropic_api_key="test_key"
+        mock_update, mock_context = make_admin_update(
+            ADMIN_USER_ID, [str(TEST_CHAT_ID), TEST_CHAT_NAME], TEST_SETTINGS
         )
-
-        mock_update = MagicMock()
-        mock_update.effective_user = MagicMock()
-        mock_update.effective_user.id = admin_user_id
-        mock_update.message = MagicMock()
-        mock_update.message.reply_text = AsyncMock()
-
-        mock_context = MagicMock()
-        mock_context.args = [str(test_chat_id), test_chat_name]
-        mock_context.bot_data = {"settings": settings}
-
-        # Step 2: Admin executes /add_chat command
-        with pytest.MonkeyPatch.context() as mp:
-            def mock_get_session():
-                class SessionContext:
-                    def __enter__(self):
-                        return db_session
-                    def __exit__(self, *args):
-                        pass
-                return SessionContext()
-
-            mp.setattr(
-                'src.handlers.admin_commands.get_db_session',
-                mock_get_session
-            )
-
-            await add_chat_command(mock_update, mock_context)
-
-        # Verify: Chat was added to whitelist
         chat_repo = ChatRepository(db_session)
-        added_chat = chat_repo.get_chat_by_id(test_chat_id)
+        message_repo = MessageRepository(db_session)
+
+        # Step 1: Admin executes /add_chat command
+        await add_chat_command(mock_update, mock_context)
+
+        # Step 2: Verify chat was added to whitelist
+        added_chat = chat_repo.get_chat_by_id(TEST_CHAT_ID)
 
         assert added_chat is not None, "Chat should be added to whitelist"
-        assert added_chat.chat_id == test_chat_id
-        assert added_chat.chat_name == test_chat_name
+        assert added_chat.chat_id == TEST_CHAT_ID
+        assert added_chat.chat_name == TEST_CHAT_NAME
         assert added_chat.enabled is True, "Chat should be enabled"
 
         # Verify: Admin received success message
@@ -84,196 +121,53 @@ class TestAdminChatWorkflow:
         success_message = mock_update.message.reply_text.call_args[0][0]
         assert "✅ Chat added to whitelist" in success_message
 
-        # Step 3: Simulate message arriving from the whitelisted chat
-        mock_message_update = MagicMock()
-        mock_message = MagicMock()
-        mock_message.chat_id = test_chat_id
-        mock_message.message_id = 100
-        mock_message.text = "Test message from partner channel"
-        mock_message.date = datetime.now()
-
-        mock_user = MagicMock()
-        mock_user.id = 999888777
-        mock_user.full_name = "Partner User"
-        mock_message.from_user = mock_user
-
-        mock_message_update.message = mock_message
-
-        # Step 4: Bot handles the message
-        collector = MessageCollectorService()
-
-        with pytest.MonkeyPatch.context() as mp:
-            def mock_get_session():
-                class SessionContext:
-                    def __enter__(self):
-                        return db_session
-                    def __exit__(self, *args):
-                        pass
-                return SessionContext()
-
-            mp.setattr(
-                'src.services.message_collector_service.get_db_session',
-                mock_get_session
-            )
-
-            await collector.handle_message(mock_message_update, None)
-
-        # Verify: Message was collected and stored
-        message_repo = MessageRepository(db_session)
-        saved_message = message_repo.get_message_by_id(test_chat_id, 100)
+        # Step 3: Message arrives from the whitelisted chat and is collected
+        mock_message_update = make_message_update(
+            TEST_CHAT_ID, 100, "Test message from partner channel",
+            PARTNER_USER_ID, PARTNER_USER_NAME
+        )
+
+        await message_collector.handle_message(mock_message_update, None)
+
+        saved_message = message_repo.get_message_by_id(TEST_CHAT_ID, 100)
 
         assert saved_message is not None, "Message should be collected from whitelisted chat"
-        assert saved_message.chat_id == test_chat_id
+        assert saved_message.chat_id == TEST_CHAT_ID
         assert saved_message.message_id == 100
         assert saved_message.text == "Test message from partner channel"
-        assert saved_message.user_id == 999888777
-        assert saved_message.user_name == "Partner User"
+        assert saved_message.user_id == PARTNER_USER_ID
+        assert saved_message.user_name == PARTNER_USER_NAME
 
-    async def test_admin_removes_chat_then_messages_ignored(self, db_session):
-        """Test E2E: Admin removes chat from whitelist → Bot ignores messages from it.
+        # Step 4: Admin executes /remove_chat command (same mocks, new args)
+        mock_update.message.reply_text.reset_mock()
+        mock_context.args = [str(TEST_CHAT_ID)]
 
-        Workflow:
-        1. Chat exists in whitelist (enabled=True)
-        2. Message from chat is collected (verify baseline behavior)
-        3. Admin executes /remove_chat command
-        4. Chat is disabled (enabled=False)
-        5. New message arrives from same chat
-        6. Bot ignores the message (does not store it)
+        await remove_chat_command(mock_update, mock_context)
 
-        Args:
-            db_session: Database session fixture
-        """
-        # Step 1: Setup - Chat already exists in whitelist
-        admin_user_id = 123456789
-        test_chat_id = -1001234567890
-        test_chat_name = "Partner Channel"
-
-        settings = Settings(
-            telegram_bot_token="test_token",
-            admin_user_id=admin_user_id,
-            anthropic_api_key="test_key"
-        )
+        # Step 5: Verify chat was disabled
+        db_session.refresh(added_chat)  # Reload this row from database
 
-        chat_repo = ChatRepository(db_session)
-        from src.models.chat import Chat
-        existing_chat = Chat(
-            chat_id=test_chat_id,
-            chat_name=test_chat_name,
-            enabled=True
-        )
-        chat_repo.save_chat(existing_chat)
-
-        # Step 2: Verify baseline - Messages from enabled chat are collected
-        mock_message_update = MagicMock()
-        mock_message = MagicMock()
-        mock_message.chat_id = test_chat_id
-        mock_message.message_id = 100
-        mock_message.text = "Message before removal"
-        mock_message.date = datetime.now()
-
-        mock_user = MagicMock()
-        mock_user.id = 999888777
-        mock_user.full_name = "Partner User"
-        mock_message.from_user = mock_user
-
-        mock_message_update.message = mock_message
-
-        collector = MessageCollectorService()
-
-        with pytest.MonkeyPatch.context() as mp:
-            def mock_get_session():
-                class SessionContext:
-                    def __enter__(self):
-                        return db_session
-                    def __exit__(self, *args):
-                        pass
-                return SessionContext()
-
-            mp.setattr(
-                'src.services.message_collector_service.get_db_session',
-                mock_get_session
-            )
-
-            await collector.handle_message(mock_message_update, None)
-
-        # Verify: Message was collected (baseline)
-        message_repo = MessageRepository(db_session)
-        baseline_message = message_repo.get_message_by_id(test_chat_id, 100)
-        assert baseline_message is not None, "Baseline: Message should be collected from enabled chat"
-
-        # Step 3: Admin executes /remove_chat command
-        mock_update = MagicMock()
-        mock_update.effective_user = MagicMock()
-        mock_update.effective_user.id = admin_user_id
-        mock_update.message = MagicMock()
-        mock_update.message.reply_text = AsyncMock()
-
-        mock_context = MagicMock()
-        mock_context.args = [str(test_chat_id)]
-        mock_context.bot_data = {"settings": settings}
-
-        with pytest.MonkeyPatch.context() as mp:
-            def mock_get_session():
-                class SessionContext:
-                    def __enter__(self):
-                        return db_session
-                    def __exit__(self, *args):
-                        pass
-                return SessionContext()
-
-            mp.setattr(
-                'src.handlers.admin_commands.get_db_session',
-                mock_get_session
-            )
-
-            await remove_chat_command(mock_update, mock_context)
-
-        # Step 4: Verify chat was disabled
-        db_session.expire_all()  # Refresh from database
-        removed_chat = chat_repo.get_chat_by_id(test_chat_id)
-
-        assert removed_chat is not None, "Chat should still exist (soft delete)"
-        assert removed_chat.enabled is False, "Chat should be disabled after removal"
+        assert added_chat.enabled is False, "Chat should be disabled after removal"
 
         # Verify: Admin received success message
         mock_update.message.reply_text.assert_called()
         success_message = mock_update.message.reply_text.call_args[0][0]
         assert "✅ Chat removed from whitelist" in success_message
 
-        # Step 5: Simulate new message arriving from the disabled chat
-        mock_new_message_update = MagicMock()
-        mock_new_message = MagicMock()
-        mock_new_message.chat_id = test_chat_id
-        mock_new_message.message_id = 200  # Different message ID
-        mock_new_message.text = "Message after removal - should be ignored"
-        mock_new_message.date = datetime.now()
-
-        mock_new_message.from_user = mock_user
-        mock_new_message_update.message = mock_new_message
-
-        # Step 6: Bot handles the new message
-        with pytest.MonkeyPatch.context() as mp:
-            def mock_get_session():
-                class SessionContext:
-                    def __enter__(self):
-                        return db_session
-                    def __exit__(self, *args):
-                        pass
-                return SessionContext()
-
-            mp.setattr(
-                'src.services.message_collector_service.get_db_session',
-                mock_get_session
-            )
-
-            await collector.handle_message(mock_new_message_update, None)
-
-        # Verify: New message was NOT collected (ignored)
-        ignored_message = message_repo.get_message_by_id(test_chat_id, 200)
+        # Step 6: New message from the disabled chat is ignored
+        mock_new_message_update = make_message_update(
+            TEST_CHAT_ID, 200,  # Different message ID
+            "Message after removal - should be ignored",
+            PARTNER_USER_ID, PARTNER_USER_NAME
+        )
+
+        await message_collector.handle_message(mock_new_message_update, None)
+
+        ignored_message = message_repo.get_message_by_id(TEST_CHAT_ID, 200)
 
         assert ignored_message is None, "Message should be ignored from disabled chat"
 
-        # Verify: Only the baseline message exists, not the new one
-        all_messages = message_repo.get_messages_last_24h(test_chat_id)
-        assert len(all_messages) == 1, "Only baseline message should exist"
-        assert all_messages[0].message_id == 100, "Should be the baseline message"
+        # Verify: Only the message collected before removal exists
+        # (counted directly: FIXED_NOW falls outside the rolling 24h window)
+        assert message_repo.count_messages(chat_id=TEST_CHAT_ID) == 1, "Only pre-removal message should exist"
+        assert message_repo.get_message_by_id(TEST_CHAT_ID, 100) is not None, "Should be the pre-removal message"
@@ -5,6 +5,7 @@ Run this script to quickly test Claude API authentication and message analysis.
 Usage:
     python tests/manual/test_claude_api_simple.py
 """
+import asyncio
 import os
 import sys
 from datetime import datetime
@@ -18,12 +19,27 @@ from dotenv import load_dotenv
 from src.config.settings import Settings
 from src.services.claude_api_service import ClaudeAPIService
 from src.models.message import Message
+from tests.fixtures.test_messages_dataset import KNOWN_QUESTIONS
 
 # Load environment variables
 load_dotenv()
 
-
-def test_api_authentication():
+# Sample for test 3: first 5 known questions, to save API costs. Built once
+# at import; analyze_messages only reads these objects.
+_SAMPLE_MESSAGES = tuple(
+    Message(
+        chat_id=123,
+        message_id=q.id,
+        user_id=1,
+        user_name="Test User",
+        text=q.text,
+        timestamp=q.timestamp,
+    )
+    for q in KNOWN_QUESTIONS[:5]
+)
+
+
+def test_api_authentication(claude_service: ClaudeAPIService):
     """Test 1: Verify Claude API authentication"""
     print("\n" + "="*60)
     print("TEST 1: Claude API Authentication")
@@ -33,21 +49,16 @@ def test_api_authentication():
     assert api_key, "ANTHROPIC_API_KEY not found in environment"
     print(f"✅ API Key found: {api_key[:10]}...{api_key[-4:]}")
 
-    settings = Settings.from_env()
-    claude_service = ClaudeAPIService(settings=settings)
     print("✅ ClaudeAPIService initialized successfully")
     assert claude_service is not None
 
 
-async def test_simple_analysis():
+async def test_simple_analysis(claude_service: ClaudeAPIService):
     """Test 2: Simple message analysis"""
     print("\n" + "="*60)
     print("TEST 2: Simple Message Analysis")
     print("="*60)
 
-    settings = Settings.from_env()
-    claude_service = ClaudeAPIService(settings=settings)
-
     # Create test messages
     test_messages = [
         Message(
@@ -96,72 +107,62 @@ async def test_simple_analysis():
     assert result.summary is not None
 
 
-async def test_question_detection_accuracy():
+async def test_question_detection_accuracy(claude_service: ClaudeAPIService):
     """Test 3: Question detection with known dataset"""
     print("\n" + "="*60)
     print("TEST 3: Question Detection Accuracy (Sample)")
     print("="*60)
 
-    from tests.fixtures.test_messages_dataset import KNOWN_QUESTIONS
-
-    settings = Settings.from_env()
-    claude_service = ClaudeAPIService(settings=settings)
-
-    # Test with first 5 questions to save API costs
-    sample_questions = KNOWN_QUESTIONS[:5]
-
-    print(f"📨 Testing with {len(sample_questions)} known questions...")
-
-    test_messages = []
-    for q in sample_questions:
-        test_messages.append(Message(
-            chat_id=123,
-            message_id=q["id"],
-            user_id=1,
-            user_name="Test User",
-            text=q["text"],
-            timestamp=q["timestamp"],
-        ))
+    print(f"📨 Testing with {len(_SAMPLE_MESSAGES)} known questions...")
 
     print("\n🔄 Analyzing with Claude API...")
-    result = await claude_service.analyze_messages(test_messages)
+    result = await claude_service.analyze_messages(list(_SAMPLE_MESSAGES))
 
     detected_count = len(result.questions)
-    accuracy = (detected_count / len(sample_questions)) * 100
+    accuracy = (detected_count / len(_SAMPLE_MESSAGES)) * 100
 
     print(f"\n✅ Analysis completed!")
     print(f"📊 Results:")
-    print(f"   Expected questions: {len(sample_questions)}")
+    print(f"   Expected questions: {len(_SAMPLE_MESSAGES)}")
     print(f"   Detected questions: {detected_count}")
     print(f"   Accuracy: {accuracy:.1f}%")
 
     # 80% threshold for sample
-    assert detected_count >= len(sample_questions) * 0.8, \
+    assert detected_count >= len(_SAMPLE_MESSAGES) * 0.8, \
         f"Accuracy {accuracy:.1f}% below threshold (80%)"
     print(f"   ✅ Accuracy meets threshold (≥80%)")
 
 
-def main():
-    """Run all tests"""
+async def main():
+    """Run all tests concurrently; the API calls are independent and I/O-bound"""
     print("\n" + "="*60)
     print("🧪 CLAUDE API INTEGRATION TESTS")
     print("="*60)
 
-    results = {
-        "Authentication": test_api_authentication(),
-        "Simple Analysis": test_simple_analysis(),
-        "Question Detection": test_question_detection_accuracy(),
-    }
+    # One service (and HTTP connection pool) is shared by all three tests;
+    # under pytest the session-scoped claude_service fixture plays this role
+    claude_service = ClaudeAPIService(settings=Settings.from_env())
+
+    outcomes = await asyncio.gather(
+        asyncio.to_thread(test_api_authentication, claude_service),
+        test_simple_analysis(claude_service),
+        test_question_detection_accuracy(claude_service),
+        return_exceptions=True,
+    )
+    # Each entry is None on success or the exception the test raised
+    results = dict(zip(
+        ("Authentication", "Simple Analysis", "Question Detection"), outcomes
+    ))
 
     print("\n" + "="*60)
     print("📊 TEST SUMMARY")
     print("="*60)
 
-    passed = sum(1 for v in results.values() if v)
+    passed = sum(1 for error in results.values() if error is None)
     total = len(results)
 
-    for test_name, result in results.items():
-        status = "✅ PASSED" if result else "❌ FAILED"
+    for test_name, error in results.items():
+        status = "✅ PASSED" if error is None else f"❌ FAILED ({error!r})"
         print(f"   {test_name}: {status}")
 
     print(f"\nTotal: {passed}/{total} tests passed")
@@ -179,4 +180,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    exit(asyncio.run(main()))
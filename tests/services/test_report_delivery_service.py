@@ -1,16 +1,30 @@
 """Tests for ReportDeliveryService - focusing on formatting and business logic."""
 
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 from src.services.report_delivery_service import ReportDeliveryService
 from src.services.claude_api_service import AnalysisResult, AnalysisSummary, QuestionAnalysis
 
 
+@pytest.fixture(scope="module", autouse=True)
+def patch_bot():
+    """Patch the Telegram Bot once for every service built in this module.
+
+    Each Bot(...) call still returns a fresh MagicMock, so services never
+    share send_message mocks.
+    """
+    with patch(
+        'src.services.report_delivery_service.Bot',
+        side_effect=lambda *args, **kwargs: MagicMock()
+    ) as mock_bot:
+        yield mock_bot
+
+
 class TestReportFormatting:
     """Test suite for report formatting logic."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_settings(self):
         """Create mock settings."""
         settings = Mock()
@@ -18,16 +32,26 @@ class TestReportFormatting:
         settings.anthropic_api_key = "test_key"
         return settings
 
+    @pytest.fixture(scope="class")
+    def formatting_service(self, mock_settings):
+        """Create ReportDeliveryService shared by read-only formatting tests."""
+        return ReportDeliveryService(settings=mock_settings)
+
     @pytest.fixture
     def service(self, mock_settings):
-        """Create ReportDeliveryService instance with mocks."""
-        with patch('src.services.report_delivery_service.Bot'):
-            service = ReportDeliveryService(settings=mock_settings)
-            return service
+        """Create ReportDeliveryService for tests that reassign bot methods."""
+        return ReportDeliveryService(settings=mock_settings)
 
     @pytest.fixture
-    def sample_analysis(self):
-        """Create sample analysis result."""
+    def mock_sleep(self, monkeypatch):
+        """Replace the service's sleep hook with a no-op AsyncMock."""
+        sleep = AsyncMock()
+        monkeypatch.setattr(ReportDeliveryService, '_sleep', sleep)
+        return sleep
+
+    @pytest.fixture(scope="class")
+    def base_sample_analysis(self):
+        """Create sample analysis result shared by read-only tests."""
         return AnalysisResult(
             questions=[
                 QuestionAnalysis(
@@ -54,9 +78,14 @@ class TestReportFormatting:
             )
         )
 
-    def test_format_report_contains_required_elements(self, service, sample_analysis):
+    @pytest.fixture
+    def sample_analysis(self, base_sample_analysis):
+        """Create a private deep copy of the sample analysis for tests that mutate it."""
+        return base_sample_analysis.model_copy(deep=True)
+
+    def test_format_report_contains_required_elements(self, formatting_service, base_sample_analysis):
         """Test that formatted report contains all required elements."""
-        report = service._format_report(sample_analysis, "Test Chat")
+        report = formatting_service._format_report(base_sample_analysis, "Test Chat")
 
         # Check header elements
         assert "#IMFReport" in report
@@ -77,19 +106,19 @@ class TestReportFormatting:
         assert "✅ Answered" in report
         assert "⏳ Pending" in report
 
-    def test_format_report_truncates_long_content(self, service, sample_analysis):
+    def test_format_report_truncates_long_content(self, formatting_service, sample_analysis):
         """Test that long reports are truncated to Telegram limit."""
         # Create a very long question text
         long_text = "x" * 5000
         sample_analysis.questions[0].text = long_text
 
-        report = service._format_report(sample_analysis, "Test Chat")
+        report = formatting_service._format_report(sample_analysis, "Test Chat")
 
         # Check that report doesn't exceed Telegram limit
-        assert len(report) <= service.MAX_MESSAGE_LENGTH
+        assert len(report) <= formatting_service.MAX_MESSAGE_LENGTH
         assert "[Report truncated due to length limit]" in report
 
-    def test_format_report_without_avg_response_time(self, service):
+    def test_format_report_without_avg_response_time(self, formatting_service):
         """Test report formatting when average response time is None."""
         analysis = AnalysisResult(
             questions=[],
@@ -102,12 +131,11 @@ class TestReportFormatting:
             )
         )
 
-        report = service._format_report(analysis, "Test Chat")
+        report = formatting_service._format_report(analysis, "Test Chat")
 
         # Should not contain response time line
         assert "Avg Response Time" not in report
 
-    @pytest.mark.asyncio
     async def test_send_telegram_report_success(self, service):
         """Test successful Telegram message sending."""
         service.bot.send_message = AsyncMock()
@@ -117,8 +145,7 @@ class TestReportFormatting:
         assert result is True
         service.bot.send_message.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_send_telegram_report_rate_limit_retry(self, service):
+    async def test_send_telegram_report_rate_limit_retry(self, service, mock_sleep):
         """Test retry logic on rate limit."""
         from telegram.error import RetryAfter
 
@@ -131,9 +158,9 @@ class TestReportFormatting:
 
         assert result is True
         assert service.bot.send_message.call_count == 2
+        mock_sleep.assert_awaited_once_with(1)
 
-    @pytest.mark.asyncio
-    async def test_send_telegram_report_failure_after_retries(self, service):
+    async def test_send_telegram_report_failure_after_retries(self, service, mock_sleep):
         """Test failure after exhausting retries."""
         from telegram.error import TelegramError
 
@@ -145,3 +172,5 @@ class TestReportFormatting:
 
         assert result is False
         assert service.bot.send_message.call_count == service.MAX_RETRIES
+        assert mock_sleep.await_count == service.MAX_RETRIES - 1
+        mock_sleep.assert_awaited_with(service.RETRY_DELAY_SECONDS)
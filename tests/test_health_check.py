@@ -1,74 +1,92 @@
 """Tests for health check server."""
 
 import pytest
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import List
 from unittest.mock import Mock
-from aiohttp import web
-from aiohttp.test_utils import AioHTTPTestCase
+from aiohttp.test_utils import TestClient, TestServer
 
 from src.health_check import HealthCheckServer
 
+# Keep the module on one xdist worker so health_client is only started once
+pytestmark = pytest.mark.xdist_group("health_check")
 
-class TestHealthCheckServer(AioHTTPTestCase):
-    """Test suite for HealthCheckServer."""
+_FIXED_RUN_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_FIXED_RUN_ISO = _FIXED_RUN_TIME.isoformat()
 
-    async def get_application(self):
-        """Create test application."""
-        # Create mock scheduler
-        mock_scheduler = Mock()
-        mock_scheduler.running = True
 
-        # Create mock job
-        mock_job = Mock()
-        mock_job.id = "test_job"
-        mock_job.name = "Test Job"
-        mock_job.next_run_time = datetime.now(timezone.utc)
+@dataclass
+class _FakeJob:
+    """Scheduled job stub exposing the fields read by the health handler."""
+    id: str
+    name: str
+    next_run_time: datetime
 
-        mock_scheduler.get_jobs = Mock(return_value=[mock_job])
 
-        # Create server
-        server = HealthCheckServer(port=8080, scheduler=mock_scheduler)
-        return server.app
+@dataclass
+class _FakeScheduler:
+    """Scheduler stub with a fixed job list."""
+    jobs: List[_FakeJob] = field(default_factory=list)
+    running: bool = True
 
-    async def test_health_endpoint(self):
-        """Test /health endpoint returns healthy status."""
-        resp = await self.client.request("GET", "/health")
-        assert resp.status == 200
+    def get_jobs(self) -> List[_FakeJob]:
+        return self.jobs
 
-        data = await resp.json()
-        assert data["status"] == "healthy"
-        assert "uptime_seconds" in data
-        assert "timestamp" in data
-        assert "scheduler" in data
 
-    async def test_root_endpoint(self):
-        """Test root endpoint also returns health status."""
-        resp = await self.client.request("GET", "/")
-        assert resp.status == 200
+@pytest.fixture(scope="module")
+async def health_client():
+    """Start the health check app once and yield a client for the module."""
+    scheduler = _FakeScheduler(jobs=[
+        _FakeJob(id="test_job", name="Test Job", next_run_time=_FIXED_RUN_TIME)
+    ])
 
-        data = await resp.json()
-        assert data["status"] == "healthy"
+    # Create server
+    server = HealthCheckServer(port=0, scheduler=scheduler)
+    async with TestClient(TestServer(server.app)) as client:
+        yield client
 
-    async def test_scheduler_status_included(self):
-        """Test scheduler status is included in response."""
-        resp = await self.client.request("GET", "/health")
-        data = await resp.json()
 
-        assert "scheduler" in data
-        assert data["scheduler"]["running"] is True
-        assert "jobs" in data["scheduler"]
-        assert len(data["scheduler"]["jobs"]) > 0
+async def test_health_endpoint(health_client):
+    """Test /health endpoint returns healthy status."""
+    resp = await health_client.get("/health")
+    assert resp.status == 200
 
-        job = data["scheduler"]["jobs"][0]
-        assert job["id"] == "test_job"
-        assert job["name"] == "Test Job"
-        assert job["next_run"] is not None
+    data = await resp.json()
+    assert data["status"] == "healthy"
+    assert "uptime_seconds" in data
+    assert "timestamp" in data
+    assert "scheduler" in data
+
+
+async def test_root_endpoint(health_client):
+    """Test root endpoint also returns health status."""
+    resp = await health_client.get("/")
+    assert resp.status == 200
+
+    data = await resp.json()
+    assert data["status"] == "healthy"
+
+
+async def test_scheduler_status_included(health_client):
+    """Test scheduler status is included in response."""
+    resp = await health_client.get("/health")
+    data = await resp.json()
+
+    assert "scheduler" in data
+    assert data["scheduler"]["running"] is True
+    assert "jobs" in data["scheduler"]
+    assert len(data["scheduler"]["jobs"]) > 0
+
+    job = data["scheduler"]["jobs"][0]
+    assert job["id"] == "test_job"
+    assert job["name"] == "Test Job"
+    assert job["next_run"] == _FIXED_RUN_ISO
 
 
 class TestHealthCheckServerWithoutScheduler:
     """Test health check without scheduler."""
 
-    @pytest.mark.asyncio
     async def test_health_without_scheduler(self):
         """Test health check when scheduler is not provided."""
         server = HealthCheckServer(port=8080, scheduler=None)
@@ -83,13 +101,14 @@ class TestHealthCheckServerWithoutScheduler:
         # (scheduler field would show running=False)
 
 
-@pytest.mark.asyncio
 async def test_server_start_stop():
     """Test server can start and stop cleanly."""
-    server = HealthCheckServer(port=8888)
+    server = HealthCheckServer(port=0)
 
     await server.start()
     assert server.runner is not None
     assert server.site is not None
+    # Port 0 lets the OS pick a free port so parallel runs never collide
+    assert server.site._server.sockets[0].getsockname()[1] != 0
 
     await server.stop()
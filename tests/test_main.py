@@ -1,12 +1,18 @@
 """Tests for main.py - BotApplication conditional startup logic."""
 
 import pytest
-from unittest.mock import AsyncMock, Mock, patch, MagicMock
-from src.main import BotApplication
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, create_autospec, sentinel
+from telegram import Update
+from telegram.ext import Application, Updater
+from src.main import BotApplication, install_event_loop_policy
 from src.config.settings import Settings
+from src.health_check import HealthCheckServer
+from src.services.telegram_bot_service import TelegramBotService
+from src.services.webhook_server import WebhookServer
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_settings_polling():
     """Create mock settings for polling mode."""
     return Settings(
@@ -20,7 +26,7 @@ def mock_settings_polling():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_settings_webhook():
     """Create mock settings for webhook mode."""
     return Settings(
@@ -34,7 +40,7 @@ def mock_settings_webhook():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_settings_production_polling():
     """Create mock settings for production polling mode."""
     return Settings(
@@ -48,29 +54,63 @@ def mock_settings_production_polling():
     )
 
 
+# Mock templates are built once at import and reset per test by make_bot_stack
+_UPDATER = create_autospec(Updater, instance=True)
+_APPLICATION = create_autospec(Application, instance=True)
+_APPLICATION.updater = _UPDATER
+_APPLICATION.__aenter__.return_value = _APPLICATION
+_BOT_SERVICE = create_autospec(TelegramBotService, instance=True)
+_BOT_SERVICE.setup.return_value = _APPLICATION
+_SCHEDULER = Mock(running=False)
+_HEALTH_SERVER = create_autospec(HealthCheckServer, instance=True)
+_WEBHOOK_SERVER = create_autospec(WebhookServer, instance=True)
+
+
+@pytest.fixture
+def make_bot_stack(mocker):
+    """Return a factory that patches BotApplication collaborators for a settings object."""
+    def make(settings):
+        for mock in (_UPDATER, _APPLICATION, _BOT_SERVICE, _SCHEDULER,
+                     _HEALTH_SERVER, _WEBHOOK_SERVER):
+            mock.reset_mock()
+
+        # Services the tests never assert against are swapped in one patch
+        mocker.patch.multiple(
+            'src.main',
+            init_db=mocker.DEFAULT,
+            MessageCollectorService=mocker.DEFAULT,
+            CleanupService=mocker.DEFAULT,
+            ReportDeliveryService=mocker.DEFAULT,
+        )
+        mocker.patch('src.main.get_settings', return_value=settings)
+        mocker.patch('src.main.TelegramBotService', return_value=_BOT_SERVICE)
+        mocker.patch('src.main.AsyncIOScheduler', return_value=_SCHEDULER)
+        mocker.patch('src.main.HealthCheckServer', return_value=_HEALTH_SERVER)
+
+        return SimpleNamespace(
+            application=_APPLICATION,
+            bot_service=_BOT_SERVICE,
+            scheduler=_SCHEDULER,
+            health_server=_HEALTH_SERVER,
+            webhook_server=_WEBHOOK_SERVER,
+            webhook_server_class=mocker.patch(
+                'src.main.WebhookServer', return_value=_WEBHOOK_SERVER
+            ),
+            sleep=mocker.patch('src.main.asyncio.sleep', new_callable=AsyncMock),
+        )
+    return make
+
+
 class TestBotApplicationInit:
     """Tests for BotApplication initialization."""
 
-    @patch('src.main.get_settings')
-    @patch('src.main.TelegramBotService')
-    @patch('src.main.MessageCollectorService')
-    @patch('src.main.CleanupService')
-    @patch('src.main.ReportDeliveryService')
-    @patch('src.main.AsyncIOScheduler')
-    @patch('src.main.HealthCheckServer')
     def test_init_initializes_webhook_server_none(
         self,
-        mock_health_server,
-        mock_scheduler,
-        mock_report_delivery,
-        mock_cleanup,
-        mock_message_collector,
-        mock_bot_service,
-        mock_get_settings,
+        make_bot_stack,
         mock_settings_polling
     ):
         """Test that webhook_server is initialized as None."""
-        mock_get_settings.return_value = mock_settings_polling
+        make_bot_stack(mock_settings_polling)
 
         app = BotApplication()
 
@@ -79,345 +119,162 @@ class TestBotApplicationInit:
         assert app.running is False
 
 
-class TestBotApplicationStartWebhookMode:
-    """Tests for BotApplication start in webhook mode."""
+class TestBotApplicationStart:
+    """Tests for BotApplication start in webhook and polling modes."""
 
-    @pytest.mark.asyncio
-    @patch('src.main.init_db')
-    @patch('src.main.get_settings')
-    async def test_start_webhook_mode_initializes_webhook_server(
+    @pytest.mark.parametrize("settings_fixture,expect_sleep", [
+        ("mock_settings_webhook", None),
+        ("mock_settings_polling", None),
+        ("mock_settings_production_polling", 60),
+    ])
+    async def test_startup_delay(
         self,
-        mock_get_settings,
-        mock_init_db,
-        mock_settings_webhook
+        request,
+        make_bot_stack,
+        settings_fixture,
+        expect_sleep
     ):
-        """Test that webhook mode initializes WebhookServer and registers webhook."""
-        mock_get_settings.return_value = mock_settings_webhook
-
-        with patch('src.main.TelegramBotService') as mock_bot_service_class, \
-             patch('src.main.MessageCollectorService'), \
-             patch('src.main.CleanupService'), \
-             patch('src.main.ReportDeliveryService'), \
-             patch('src.main.AsyncIOScheduler') as mock_scheduler_class, \
-             patch('src.main.HealthCheckServer') as mock_health_server_class, \
-             patch('src.main.WebhookServer') as mock_webhook_server_class:
-
-            # Setup mocks
-            mock_application = MagicMock()
-            mock_application.start = AsyncMock()
-            mock_application.stop = AsyncMock()
-            mock_application.__aenter__ = AsyncMock(return_value=mock_application)
-            mock_application.__aexit__ = AsyncMock()
-
-            mock_bot_service = Mock()
-            mock_bot_service.setup = Mock(return_value=mock_application)
-            mock_bot_service.setup_webhook = AsyncMock()
-            mock_bot_service.remove_webhook = AsyncMock()
-            mock_bot_service_class.return_value = mock_bot_service
-
-            mock_scheduler = Mock()
-            mock_scheduler.start = Mock()
-            mock_scheduler.running = False
-            mock_scheduler_class.return_value = mock_scheduler
-
-            mock_health_server = Mock()
-            mock_health_server.start = AsyncMock()
-            mock_health_server.stop = AsyncMock()
-            mock_health_server_class.return_value = mock_health_server
-
-            mock_webhook_server = Mock()
-            mock_webhook_server.start = AsyncMock()
-            mock_webhook_server.stop = AsyncMock()
-            mock_webhook_server_class.return_value = mock_webhook_server
-
-            app = BotApplication()
-
-            # Simulate running briefly then stopping
-            async def simulate_running():
-                app.running = False  # Stop immediately for test
-
-            with patch.object(app, '_keep_running', side_effect=simulate_running):
-                await app.start()
-
-            # Verify webhook server was created and started
-            mock_webhook_server_class.assert_called_once_with(
-                application=mock_application,
-                settings=mock_settings_webhook
-            )
-            mock_webhook_server.start.assert_called_once()
-
-            # Verify webhook was registered with Telegram
-            mock_bot_service.setup_webhook.assert_called_once_with(
-                webhook_url=mock_settings_webhook.webhook_url,
-                secret_token=mock_settings_webhook.webhook_secret_token
-            )
-
-
-    @pytest.mark.asyncio
-    @patch('src.main.init_db')
-    @patch('src.main.get_settings')
-    async def test_start_webhook_mode_no_startup_delay(
+        """Test only production polling waits for the previous instance to disconnect."""
+        stack = make_bot_stack(request.getfixturevalue(settings_fixture))
+
+        app = BotApplication()
+        await app._apply_startup_delay()
+
+        if expect_sleep:
+            stack.sleep.assert_awaited_once_with(expect_sleep)
+        else:
+            stack.sleep.assert_not_awaited()
+
+    async def test_start_webhook_mode_initializes_webhook_server(
         self,
-        mock_get_settings,
-        mock_init_db,
+        make_bot_stack,
         mock_settings_webhook
     ):
-        """Test that webhook mode doesn't apply production startup delay."""
-        mock_get_settings.return_value = mock_settings_webhook
-
-        with patch('src.main.TelegramBotService') as mock_bot_service_class, \
-             patch('src.main.MessageCollectorService'), \
-             patch('src.main.CleanupService'), \
-             patch('src.main.ReportDeliveryService'), \
-             patch('src.main.AsyncIOScheduler') as mock_scheduler_class, \
-             patch('src.main.HealthCheckServer') as mock_health_server_class, \
-             patch('src.main.WebhookServer') as mock_webhook_server_class, \
-             patch('src.main.asyncio.sleep') as mock_sleep:
-
-            # Setup mocks
-            mock_application = MagicMock()
-            mock_application.start = AsyncMock()
-            mock_application.stop = AsyncMock()
-            mock_application.__aenter__ = AsyncMock(return_value=mock_application)
-            mock_application.__aexit__ = AsyncMock()
-
-            mock_bot_service = Mock()
-            mock_bot_service.setup = Mock(return_value=mock_application)
-            mock_bot_service.setup_webhook = AsyncMock()
-            mock_bot_service.remove_webhook = AsyncMock()
-            mock_bot_service_class.return_value = mock_bot_service
-
-            mock_scheduler = Mock()
-            mock_scheduler.start = Mock()
-            mock_scheduler.running = False
-            mock_scheduler_class.return_value = mock_scheduler
-
-            mock_health_server = Mock()
-            mock_health_server.start = AsyncMock()
-            mock_health_server.stop = AsyncMock()
-            mock_health_server_class.return_value = mock_health_server
-
-            mock_webhook_server = Mock()
-            mock_webhook_server.start = AsyncMock()
-            mock_webhook_server.stop = AsyncMock()
-            mock_webhook_server_class.return_value = mock_webhook_server
-
-            app = BotApplication()
-
-            async def simulate_running():
-                app.running = False
-
-            with patch.object(app, '_keep_running', side_effect=simulate_running):
-                await app.start()
-
-            # Verify NO 60-second sleep was called (webhook mode in production)
-            mock_sleep.assert_not_called()
-
-
-class TestBotApplicationStartPollingMode:
-    """Tests for BotApplication start in polling mode."""
-
-    @pytest.mark.asyncio
-    @patch('src.main.init_db')
-    @patch('src.main.get_settings')
+        """Test that webhook mode initializes WebhookServer and registers webhook."""
+        stack = make_bot_stack(mock_settings_webhook)
+
+        app = BotApplication()
+        # Only passed through to WebhookServer, so identity is all that matters
+        app.application = sentinel.application
+        await app._start_webhook_mode()
+
+        stack.webhook_server_class.assert_called_once_with(
+            application=sentinel.application,
+            settings=mock_settings_webhook,
+            text_message_callback=app.message_collector.handle_message
+        )
+        stack.webhook_server.start.assert_awaited_once()
+        stack.bot_service.setup_webhook.assert_awaited_once_with(
+            webhook_url=mock_settings_webhook.webhook_url,
+            secret_token=mock_settings_webhook.webhook_secret_token
+        )
+
     async def test_start_polling_mode_starts_polling(
         self,
-        mock_get_settings,
-        mock_init_db,
+        make_bot_stack,
         mock_settings_polling
     ):
         """Test that polling mode starts the updater with polling."""
-        mock_get_settings.return_value = mock_settings_polling
-
-        with patch('src.main.TelegramBotService') as mock_bot_service_class, \
-             patch('src.main.MessageCollectorService'), \
-             patch('src.main.CleanupService'), \
-             patch('src.main.ReportDeliveryService'), \
-             patch('src.main.AsyncIOScheduler') as mock_scheduler_class, \
-             patch('src.main.HealthCheckServer') as mock_health_server_class:
-
-            # Setup mocks
-            mock_updater = Mock()
-            mock_updater.start_polling = AsyncMock()
-            mock_updater.stop = AsyncMock()
-
-            mock_application = MagicMock()
-            mock_application.start = AsyncMock()
-            mock_application.stop = AsyncMock()
-            mock_application.updater = mock_updater
-            mock_application.__aenter__ = AsyncMock(return_value=mock_application)
-            mock_application.__aexit__ = AsyncMock()
-
-            mock_bot_service = Mock()
-            mock_bot_service.setup = Mock(return_value=mock_application)
-            mock_bot_service_class.return_value = mock_bot_service
-
-            mock_scheduler = Mock()
-            mock_scheduler.start = Mock()
-            mock_scheduler.running = False
-            mock_scheduler_class.return_value = mock_scheduler
-
-            mock_health_server = Mock()
-            mock_health_server.start = AsyncMock()
-            mock_health_server.stop = AsyncMock()
-            mock_health_server_class.return_value = mock_health_server
-
-            app = BotApplication()
-
-            async def simulate_running():
-                app.running = False
-
-            with patch.object(app, '_keep_running', side_effect=simulate_running):
-                await app.start()
-
-            # Verify polling was started
-            from telegram import Update
-            mock_updater.start_polling.assert_called_once_with(
-                allowed_updates=Update.ALL_TYPES,
-                drop_pending_updates=True
-            )
-
-
-    @pytest.mark.asyncio
-    @patch('src.main.init_db')
-    @patch('src.main.get_settings')
-    async def test_start_production_polling_applies_startup_delay(
+        stack = make_bot_stack(mock_settings_polling)
+
+        app = BotApplication()
+        app.application = stack.application
+        await app._start_polling_mode()
+
+        stack.application.updater.start_polling.assert_awaited_once_with(
+            allowed_updates=Update.ALL_TYPES,
+            drop_pending_updates=True
+        )
+
+    @pytest.mark.parametrize("settings_fixture,webhook", [
+        ("mock_settings_webhook", True),
+        ("mock_settings_polling", False),
+    ])
+    async def test_start_runs_mode_and_matching_shutdown(
         self,
-        mock_get_settings,
-        mock_init_db,
-        mock_settings_production_polling
+        request,
+        mocker,
+        make_bot_stack,
+        settings_fixture,
+        webhook
     ):
-        """Test that production polling mode applies 60s startup delay."""
-        mock_get_settings.return_value = mock_settings_production_polling
+        """Test start() runs the configured mode and its matching clean stop."""
+        stack = make_bot_stack(request.getfixturevalue(settings_fixture))
+        start_webhook = mocker.patch.object(BotApplication, '_start_webhook_mode')
+        start_polling = mocker.patch.object(BotApplication, '_start_polling_mode')
+        mocker.patch.object(BotApplication, '_keep_running')
 
-        with patch('src.main.TelegramBotService') as mock_bot_service_class, \
-             patch('src.main.MessageCollectorService'), \
-             patch('src.main.CleanupService'), \
-             patch('src.main.ReportDeliveryService'), \
-             patch('src.main.AsyncIOScheduler') as mock_scheduler_class, \
-             patch('src.main.HealthCheckServer') as mock_health_server_class, \
-             patch('src.main.asyncio.sleep') as mock_sleep:
-
-            mock_sleep.return_value = AsyncMock()
-
-            # Setup mocks
-            mock_updater = Mock()
-            mock_updater.start_polling = AsyncMock()
-            mock_updater.stop = AsyncMock()
-
-            mock_application = MagicMock()
-            mock_application.start = AsyncMock()
-            mock_application.stop = AsyncMock()
-            mock_application.updater = mock_updater
-            mock_application.__aenter__ = AsyncMock(return_value=mock_application)
-            mock_application.__aexit__ = AsyncMock()
-
-            mock_bot_service = Mock()
-            mock_bot_service.setup = Mock(return_value=mock_application)
-            mock_bot_service_class.return_value = mock_bot_service
-
-            mock_scheduler = Mock()
-            mock_scheduler.start = Mock()
-            mock_scheduler.running = False
-            mock_scheduler_class.return_value = mock_scheduler
-
-            mock_health_server = Mock()
-            mock_health_server.start = AsyncMock()
-            mock_health_server.stop = AsyncMock()
-            mock_health_server_class.return_value = mock_health_server
-
-            app = BotApplication()
-
-            async def simulate_running():
-                app.running = False
-
-            with patch.object(app, '_keep_running', side_effect=simulate_running):
-                await app.start()
+        app = BotApplication()
+        await app.start()
 
-            # Verify 60-second sleep was called (production polling mode)
-            mock_sleep.assert_called_once_with(60)
+        assert start_webhook.await_count == int(webhook)
+        assert start_polling.await_count == int(not webhook)
+        assert stack.bot_service.remove_webhook.await_count == int(webhook)
+        assert stack.application.updater.stop.await_count == int(not webhook)
+        # WebhookServer serves /health in webhook mode
+        assert stack.health_server.start.await_count == int(not webhook)
+        stack.application.stop.assert_awaited_once()
 
 
 class TestBotApplicationStop:
     """Tests for BotApplication graceful shutdown."""
 
-    @pytest.mark.asyncio
-    @patch('src.main.get_settings')
-    async def test_stop_webhook_mode_removes_webhook(
+    async def test_stop_webhook_mode_stops_server_only(
         self,
-        mock_get_settings,
+        make_bot_stack,
         mock_settings_webhook
     ):
-        """Test that stopping in webhook mode removes webhook and stops server."""
-        mock_get_settings.return_value = mock_settings_webhook
-
-        with patch('src.main.TelegramBotService') as mock_bot_service_class, \
-             patch('src.main.MessageCollectorService'), \
-             patch('src.main.CleanupService'), \
-             patch('src.main.ReportDeliveryService'), \
-             patch('src.main.AsyncIOScheduler') as mock_scheduler_class, \
-             patch('src.main.HealthCheckServer') as mock_health_server_class:
+        """Test that stopping in webhook mode stops the server but leaves the webhook."""
+        stack = make_bot_stack(mock_settings_webhook)
 
-            mock_bot_service = Mock()
-            mock_bot_service.remove_webhook = AsyncMock()
-            mock_bot_service_class.return_value = mock_bot_service
-
-            mock_scheduler = Mock()
-            mock_scheduler.running = False
-            mock_scheduler_class.return_value = mock_scheduler
-
-            mock_health_server = Mock()
-            mock_health_server.stop = AsyncMock()
-            mock_health_server_class.return_value = mock_health_server
-
-            app = BotApplication()
-
-            # Simulate webhook server exists
-            mock_webhook_server = Mock()
-            mock_webhook_server.stop = AsyncMock()
-            app.webhook_server = mock_webhook_server
+        app = BotApplication()
 
-            await app.stop()
+        # Simulate webhook server exists
+        app.webhook_server = stack.webhook_server
 
-            # Verify webhook was removed and server stopped
-            mock_bot_service.remove_webhook.assert_called_once()
-            mock_webhook_server.stop.assert_called_once()
+        await app.stop()
 
+        # Webhook removal happens in start() while the application is active
+        stack.webhook_server.stop.assert_awaited_once()
+        stack.bot_service.remove_webhook.assert_not_called()
 
-    @pytest.mark.asyncio
-    @patch('src.main.get_settings')
     async def test_stop_polling_mode_no_webhook_cleanup(
         self,
-        mock_get_settings,
+        make_bot_stack,
         mock_settings_polling
     ):
         """Test that stopping in polling mode doesn't try to clean up webhook."""
-        mock_get_settings.return_value = mock_settings_polling
+        stack = make_bot_stack(mock_settings_polling)
+
+        app = BotApplication()
+        # webhook_server should be None in polling mode
+        assert app.webhook_server is None
+
+        await app.stop()
+
+        # Verify webhook cleanup was NOT called
+        stack.bot_service.remove_webhook.assert_not_called()
+
 
-        with patch('src.main.TelegramBotService') as mock_bot_service_class, \
-             patch('src.main.MessageCollectorService'), \
-             patch('src.main.CleanupService'), \
-             patch('src.main.ReportDeliveryService'), \
-             patch('src.main.AsyncIOScheduler') as mock_scheduler_class, \
-             patch('src.main.HealthCheckServer') as mock_health_server_class:
+class TestInstallEventLoopPolicy:
+    """Tests for event loop policy selection."""
 
-            mock_bot_service = Mock()
-            mock_bot_service.remove_webhook = AsyncMock()
-            mock_bot_service_class.return_value = mock_bot_service
+    def test_uses_uvloop_when_available(self, mocker):
+        """Test that uvloop policy is installed when uvloop is importable."""
+        mock_uvloop = mocker.patch('src.main.uvloop')
+        mock_set_policy = mocker.patch('src.main.asyncio.set_event_loop_policy')
 
-            mock_scheduler = Mock()
-            mock_scheduler.running = False
-            mock_scheduler_class.return_value = mock_scheduler
+        install_event_loop_policy()
 
-            mock_health_server = Mock()
-            mock_health_server.stop = AsyncMock()
-            mock_health_server_class.return_value = mock_health_server
+        mock_set_policy.assert_called_once_with(
+            mock_uvloop.EventLoopPolicy.return_value
+        )
 
-            app = BotApplication()
-            # webhook_server should be None in polling mode
-            assert app.webhook_server is None
+    def test_keeps_default_loop_without_uvloop(self, mocker):
+        """Test that the default policy is kept when uvloop is missing."""
+        mocker.patch('src.main.uvloop', None)
+        mock_set_policy = mocker.patch('src.main.asyncio.set_event_loop_policy')
 
-            await app.stop()
+        install_event_loop_policy()
 
-            # Verify webhook cleanup was NOT called
-            mock_bot_service.remove_webhook.assert_not_called()
+        mock_set_policy.assert_not_called()
@@ -1,8 +1,9 @@
 """Unit tests for admin command handlers."""
 
 import pytest
+from contextlib import nullcontext
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
-from telegram import Update, User, Message, Chat
 from telegram.ext import ContextTypes
 from datetime import datetime
 
@@ -13,161 +14,173 @@ from src.handlers.admin_commands import (
     get_chat_id_command,
     admin_help_command
 )
+from src.config.settings import Settings
 from src.models.chat import Chat as ChatModel
 from src.repositories.chat_repository import ChatRepository
 
+# Keep the module on one worker so its module-scoped fixtures are built once
+pytestmark = pytest.mark.xdist_group("admin")
+
 
 # Fixtures
 
+ADMIN_USER_ID = 123456789
+
+# Reply fragments asserted across several tests
+CHAT_ADDED = "✅ Chat added to whitelist"
+CHAT_REMOVED = "✅ Chat removed from whitelist"
+USAGE = "❌ Usage:"
+INVALID_CHAT_ID = "❌ Invalid chat_id"
+ADMIN_COMMANDS = ("/add_chat", "/remove_chat", "/list_chats", "/get_chat_id")
+
+# Settings is a plain dataclass, so no validation runs; handlers only read it
+ADMIN_SETTINGS = Settings(
+    telegram_bot_token="test_token",
+    admin_user_id=ADMIN_USER_ID,  # Matches mock_update.effective_user.id
+    anthropic_api_key="test_key"
+)
+
+
+# One reply_text mock for every update; reset before each test
+_REPLY = AsyncMock()
+
+
+def make_update(
+    user_id=ADMIN_USER_ID,
+    chat_id=-1001234567890,
+    title="Test Channel",
+    chat_type="channel",
+    first_name=None
+):
+    """Build a lightweight Telegram update with the fields the handlers read."""
+    return SimpleNamespace(
+        effective_user=SimpleNamespace(id=user_id),
+        effective_chat=SimpleNamespace(
+            id=chat_id, title=title, type=chat_type, first_name=first_name
+        ),
+        message=SimpleNamespace(reply_text=_REPLY)
+    )
+
+
+def reply_text_of(update, index=-1):
+    """Return the text passed to reply_text, by default for the latest call."""
+    return update.message.reply_text.call_args_list[index][0][0]
+
+
 @pytest.fixture
 def mock_update():
-    """Create mock Telegram update object."""
-    update = MagicMock(spec=Update)
-    update.effective_user = MagicMock(spec=User)
-    update.effective_user.id = 123456789
-    update.message = MagicMock(spec=Message)
-    update.message.reply_text = AsyncMock()
-    update.effective_chat = MagicMock(spec=Chat)
-    update.effective_chat.id = -1001234567890
-    update.effective_chat.title = "Test Channel"
-    update.effective_chat.type = "channel"
-    return update
+    """Create Telegram update from the admin user in a channel."""
+    return make_update()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_context():
-    """Create mock context with admin settings."""
-    from src.config.settings import Settings
-    context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
-    context.args = []
-    # Add settings with admin_user_id matching the mock_update fixture
-    context.bot_data = {
-        "settings": Settings(
-            telegram_bot_token="test_token",
-            admin_user_id=123456789,  # Matches mock_update.effective_user.id
-            anthropic_api_key="test_key"
-        )
-    }
-    return context
+    """Create mock context shared by the module."""
+    return MagicMock(spec=ContextTypes.DEFAULT_TYPE)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_mocks(mock_context):
+    """Restore default context state and clear replies before each test."""
+    _REPLY.reset_mock()
+    mock_context.args = []
+    mock_context.bot_data = {"settings": ADMIN_SETTINGS}
 
 
 # Tests for add_chat_command
 
-@pytest.mark.asyncio
-@patch('src.handlers.admin_commands.get_db_session')
-async def test_add_chat_success_new_chat(mock_get_db, mock_update, mock_context, db_session):
+@pytest.mark.usefixtures("patch_db_session")
+async def test_add_chat_success_new_chat(mock_update, mock_context):
     """Test successfully adding a new chat to whitelist."""
     # Setup
     mock_context.args = ["-1001234567890", "Test", "Channel"]
-    mock_get_db.return_value.__enter__.return_value = db_session
 
     # Execute
     await add_chat_command(mock_update, mock_context)
 
     # Verify
     mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    assert "✅ Chat added to whitelist" in call_args[0][0]
-    assert "-1001234567890" in call_args[0][0]
-    assert "Test Channel" in call_args[0][0]
+    message = reply_text_of(mock_update)
+    assert CHAT_ADDED in message
+    assert "-1001234567890" in message
+    assert "Test Channel" in message
 
 
-@pytest.mark.asyncio
-@patch('src.handlers.admin_commands.get_db_session')
-async def test_add_chat_success_update_existing(mock_get_db, mock_update, mock_context, db_session):
+@pytest.mark.usefixtures("patch_db_session")
+async def test_add_chat_success_update_existing(mock_update, mock_context, chat_repo):
     """Test successfully updating an existing chat."""
     # Setup - add existing chat first with NEGATIVE chat_id
     existing_chat = ChatModel(chat_id=-1001234, chat_name="Old Name", enabled=False)
-    repo = ChatRepository(db_session)
-    repo.save_chat(existing_chat)
+    chat_repo.save_chat(existing_chat)
 
     mock_context.args = ["-1001234", "Updated", "Name"]
-    mock_get_db.return_value.__enter__.return_value = db_session
-
-    # Execute
-    await add_chat_command(mock_update, mock_context)
-
-    # Verify
-    mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    assert "✅ Chat updated in whitelist" in call_args[0][0]
-    assert "Updated Name" in call_args[0][0]
-
-
-@pytest.mark.asyncio
-async def test_add_chat_missing_arguments(mock_update, mock_context):
-    """Test add_chat with missing arguments shows usage help."""
-    # Setup - no arguments
-    mock_context.args = []
 
     # Execute
     await add_chat_command(mock_update, mock_context)
 
     # Verify
     mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    assert "❌ Usage:" in call_args[0][0]
-    assert "/add_chat <chat_id> <chat_name>" in call_args[0][0]
+    message = reply_text_of(mock_update)
+    assert "✅ Chat updated in whitelist" in message
+    assert "Updated Name" in message
 
 
-@pytest.mark.asyncio
-async def test_add_chat_invalid_chat_id(mock_update, mock_context):
-    """Test add_chat with invalid (non-numeric) chat_id."""
+@pytest.mark.parametrize("args,expected", [
+    ([], (USAGE, "/add_chat <chat_id> <chat_name>")),
+    (["invalid_id", "Test", "Channel"], (INVALID_CHAT_ID,)),
+], ids=["missing_arguments", "invalid_chat_id"])
+async def test_add_chat_bad_input(mock_update, mock_context, args, expected):
+    """Test add_chat rejects missing arguments and non-numeric chat_id."""
     # Setup
-    mock_context.args = ["invalid_id", "Test", "Channel"]
+    mock_context.args = args
 
     # Execute
     await add_chat_command(mock_update, mock_context)
 
     # Verify
     mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    assert "❌ Invalid chat_id" in call_args[0][0]
+    message = reply_text_of(mock_update)
+    for text in expected:
+        assert text in message
 
 
-@pytest.mark.asyncio
-@patch('src.handlers.admin_commands.get_db_session')
-async def test_add_chat_positive_id_warning(mock_get_db, mock_update, mock_context, db_session):
+@pytest.mark.usefixtures("patch_db_session")
+async def test_add_chat_positive_id_warning(mock_update, mock_context):
     """Test add_chat with positive chat_id shows warning AND adds chat."""
     # Setup
     mock_context.args = ["12345", "Test", "User"]
-    mock_get_db.return_value.__enter__.return_value = db_session
 
     # Execute
     await add_chat_command(mock_update, mock_context)
 
     # Verify - should show warning about positive chat_id (first call) AND success message (second call)
     assert mock_update.message.reply_text.call_count == 2
-    first_call_args = mock_update.message.reply_text.call_args_list[0]
-    second_call_args = mock_update.message.reply_text.call_args_list[1]
+    warning = reply_text_of(mock_update, 0)
+    success = reply_text_of(mock_update, 1)
 
-    assert "⚠️ Warning" in first_call_args[0][0]
-    assert "should typically be negative" in first_call_args[0][0]
-    assert "✅ Chat added to whitelist" in second_call_args[0][0]
+    assert "⚠️ Warning" in warning
+    assert "should typically be negative" in warning
+    assert CHAT_ADDED in success
 
 
 # Tests for list_chats_command
 
-@pytest.mark.asyncio
-@patch('src.handlers.admin_commands.get_db_session')
-async def test_list_chats_with_chats(mock_get_db, mock_update, mock_context, db_session):
+@pytest.mark.usefixtures("patch_db_session")
+async def test_list_chats_with_chats(mock_update, mock_context, db_session):
     """Test listing chats when chats exist."""
     # Setup - add some chats
-    repo = ChatRepository(db_session)
-    chat1 = ChatModel(chat_id=-1001, chat_name="Chat 1", enabled=True)
-    chat2 = ChatModel(chat_id=-1002, chat_name="Chat 2", enabled=True)
-    repo.save_chat(chat1)
-    repo.save_chat(chat2)
-
-    mock_get_db.return_value.__enter__.return_value = db_session
+    db_session.add_all([
+        ChatModel(chat_id=-1001, chat_name="Chat 1", enabled=True),
+        ChatModel(chat_id=-1002, chat_name="Chat 2", enabled=True),
+    ])
+    db_session.flush()
 
     # Execute
     await list_chats_command(mock_update, mock_context)
 
     # Verify
     mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    message = call_args[0][0]
+    message = reply_text_of(mock_update)
     assert "📋 *Whitelisted Chats:*" in message
     assert "Chat 1" in message
     assert "Chat 2" in message
@@ -175,146 +188,109 @@ async def test_list_chats_with_chats(mock_get_db, mock_update, mock_context, db_
     assert "-1002" in message
 
 
-@pytest.mark.asyncio
-@patch('src.handlers.admin_commands.get_db_session')
-async def test_list_chats_empty(mock_get_db, mock_update, mock_context, db_session):
+@pytest.mark.usefixtures("patch_db_session")
+async def test_list_chats_empty(mock_update, mock_context):
     """Test listing chats when no chats exist."""
     # Setup - empty database
-    mock_get_db.return_value.__enter__.return_value = db_session
 
     # Execute
     await list_chats_command(mock_update, mock_context)
 
     # Verify
     mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    assert "📭 No whitelisted chats found" in call_args[0][0]
+    message = reply_text_of(mock_update)
+    assert "📭 No whitelisted chats found" in message
 
 
 # Tests for remove_chat_command
 
-@pytest.mark.asyncio
-@patch('src.handlers.admin_commands.get_db_session')
-async def test_remove_chat_success(mock_get_db, mock_update, mock_context, db_session, sample_chat):
+@pytest.mark.usefixtures("patch_db_session")
+async def test_remove_chat_success(mock_update, mock_context, chat_repo, sample_chat):
     """Test successfully removing a chat."""
     # Setup - add chat first
-    repo = ChatRepository(db_session)
-    repo.save_chat(sample_chat)
+    chat_repo.save_chat(sample_chat)
 
     mock_context.args = [str(sample_chat.chat_id)]
-    mock_get_db.return_value.__enter__.return_value = db_session
 
     # Execute
     await remove_chat_command(mock_update, mock_context)
 
     # Verify
     mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    assert "✅ Chat removed from whitelist" in call_args[0][0]
-    assert sample_chat.chat_name in call_args[0][0]
+    message = reply_text_of(mock_update)
+    assert CHAT_REMOVED in message
+    assert sample_chat.chat_name in message
 
     # Verify chat is soft deleted (enabled=False)
-    chat = repo.get_chat_by_id(sample_chat.chat_id)
+    chat = chat_repo.get_chat_by_id(sample_chat.chat_id)
     assert chat is not None
     assert chat.enabled is False
 
 
-@pytest.mark.asyncio
-@patch('src.handlers.admin_commands.get_db_session')
-async def test_remove_chat_not_found(mock_get_db, mock_update, mock_context, db_session):
+@pytest.mark.usefixtures("patch_db_session")
+async def test_remove_chat_not_found(mock_update, mock_context):
     """Test removing non-existent chat."""
     # Setup
     mock_context.args = ["-999999"]
-    mock_get_db.return_value.__enter__.return_value = db_session
-
-    # Execute
-    await remove_chat_command(mock_update, mock_context)
-
-    # Verify
-    mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    assert "❌ Chat not found" in call_args[0][0]
-
-
-@pytest.mark.asyncio
-async def test_remove_chat_missing_arguments(mock_update, mock_context):
-    """Test remove_chat with missing arguments shows usage help."""
-    # Setup - no arguments
-    mock_context.args = []
 
     # Execute
     await remove_chat_command(mock_update, mock_context)
 
     # Verify
     mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    assert "❌ Usage:" in call_args[0][0]
-    assert "/remove_chat <chat_id>" in call_args[0][0]
+    message = reply_text_of(mock_update)
+    assert "❌ Chat not found" in message
 
 
-@pytest.mark.asyncio
-async def test_remove_chat_invalid_chat_id(mock_update, mock_context):
-    """Test remove_chat with invalid chat_id."""
+@pytest.mark.parametrize("args,expected", [
+    ([], (USAGE, "/remove_chat <chat_id>")),
+    (["invalid"], (INVALID_CHAT_ID,)),
+], ids=["missing_arguments", "invalid_chat_id"])
+async def test_remove_chat_bad_input(mock_update, mock_context, args, expected):
+    """Test remove_chat rejects missing arguments and non-numeric chat_id."""
     # Setup
-    mock_context.args = ["invalid"]
+    mock_context.args = args
 
     # Execute
     await remove_chat_command(mock_update, mock_context)
 
     # Verify
     mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    assert "❌ Invalid chat_id" in call_args[0][0]
+    message = reply_text_of(mock_update)
+    for text in expected:
+        assert text in message
 
 
 # Tests for get_chat_id_command
 
-@pytest.mark.asyncio
-async def test_get_chat_id_in_channel(mock_update, mock_context):
-    """Test get_chat_id in a channel."""
+@pytest.mark.parametrize("chat_kwargs,expected", [
+    (
+        dict(chat_id=-1001234567890, title="Test Channel", chat_type="channel"),
+        ("🆔 *Chat Information:*", "-1001234567890", "Test Channel", "channel",
+         "/add_chat -1001234567890"),
+    ),
+    (
+        dict(chat_id=123456789, title=None, first_name="John", chat_type="private"),
+        ("123456789", "John", "private"),
+    ),
+], ids=["channel", "private_chat"])
+async def test_get_chat_id(mock_context, chat_kwargs, expected):
+    """Test get_chat_id reports the chat's id, title and type."""
     # Setup
-    mock_update.effective_chat.id = -1001234567890
-    mock_update.effective_chat.title = "Test Channel"
-    mock_update.effective_chat.type = "channel"
+    mock_update = make_update(**chat_kwargs)
 
     # Execute
     await get_chat_id_command(mock_update, mock_context)
 
     # Verify
     mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "🆔 *Chat Information:*" in message
-    assert "-1001234567890" in message
-    assert "Test Channel" in message
-    assert "channel" in message
-    assert "/add_chat -1001234567890" in message
-
-
-@pytest.mark.asyncio
-async def test_get_chat_id_in_private_chat(mock_update, mock_context):
-    """Test get_chat_id in a private chat."""
-    # Setup
-    mock_update.effective_chat.id = 123456789
-    mock_update.effective_chat.title = None
-    mock_update.effective_chat.first_name = "John"
-    mock_update.effective_chat.type = "private"
-
-    # Execute
-    await get_chat_id_command(mock_update, mock_context)
-
-    # Verify
-    mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    message = call_args[0][0]
-    assert "123456789" in message
-    assert "John" in message
-    assert "private" in message
+    message = reply_text_of(mock_update)
+    for text in expected:
+        assert text in message
 
 
 # Tests for admin_help_command
 
-@pytest.mark.asyncio
 async def test_admin_help_command(mock_update, mock_context):
     """Test admin help command shows all commands."""
     # Execute
@@ -322,63 +298,80 @@ async def test_admin_help_command(mock_update, mock_context):
 
     # Verify
     mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    message = call_args[0][0]
+    message = reply_text_of(mock_update)
 
     # Check all commands are documented
     assert "🔧 *Admin Commands*" in message
-    assert "/add_chat" in message
-    assert "/remove_chat" in message
-    assert "/list_chats" in message
-    assert "/get_chat_id" in message
+    missing = [command for command in ADMIN_COMMANDS if command not in message]
+    assert not missing
 
 
 # Integration-style tests with real database operations
 
-@pytest.mark.asyncio
-@patch('src.handlers.admin_commands.get_db_session')
-async def test_admin_workflow_add_list_remove(mock_get_db, mock_update, mock_context, db_session):
-    """Test complete admin workflow: add chat -> list -> remove."""
-    mock_get_db.return_value.__enter__.return_value = db_session
-
-    # Step 1: Add chat
-    mock_context.args = ["-1001234", "Test", "Channel"]
-    await add_chat_command(mock_update, mock_context)
-    assert mock_update.message.reply_text.call_count == 1
-    assert "✅ Chat added" in mock_update.message.reply_text.call_args[0][0]
-
-    # Step 2: List chats
-    mock_update.message.reply_text.reset_mock()
-    await list_chats_command(mock_update, mock_context)
-    assert mock_update.message.reply_text.call_count == 1
-    message = mock_update.message.reply_text.call_args[0][0]
-    assert "Test Channel" in message
-    assert "-1001234" in message
-
-    # Step 3: Remove chat
-    mock_update.message.reply_text.reset_mock()
-    mock_context.args = ["-1001234"]
-    await remove_chat_command(mock_update, mock_context)
-    assert mock_update.message.reply_text.call_count == 1
-    assert "✅ Chat removed" in mock_update.message.reply_text.call_args[0][0]
-
-    # Step 4: Verify chat is disabled
-    repo = ChatRepository(db_session)
-    chat = repo.get_chat_by_id(-1001234)
-    assert chat is not None
-    assert chat.enabled is False
+class TestAdminWorkflow:
+    """Admin workflow add -> list -> remove, one step per test in order.
+
+    The steps share one chat and one session, so each builds on the state
+    left by the previous one. pytest runs them in definition order, and the
+    module's xdist_group mark keeps them on one worker.
+    """
+
+    CHAT_ID = -1001234
+
+    @pytest.fixture(scope="class", autouse=True)
+    def workflow_session(self, class_db_session):
+        """Route get_db_session() to a session shared by the workflow steps."""
+        with patch(
+            'src.handlers.admin_commands.get_db_session',
+            return_value=nullcontext(class_db_session)
+        ):
+            yield class_db_session
+
+    async def test_step1_add_chat(self, mock_update, mock_context, workflow_session):
+        """Test adding the chat stores it enabled."""
+        mock_context.args = [str(self.CHAT_ID), "Test", "Channel"]
+        await add_chat_command(mock_update, mock_context)
+        assert mock_update.message.reply_text.call_count == 1
+        assert CHAT_ADDED in reply_text_of(mock_update)
+
+        # Verify chat was stored
+        chat = ChatRepository(workflow_session).get_chat_by_id(self.CHAT_ID)
+        assert chat is not None
+        assert chat.chat_name == "Test Channel"
+        assert chat.enabled is True
+
+    async def test_step2_list_chats(self, mock_update, mock_context):
+        """Test the added chat is listed."""
+        await list_chats_command(mock_update, mock_context)
+        assert mock_update.message.reply_text.call_count == 1
+        message = reply_text_of(mock_update)
+        assert "Test Channel" in message
+        assert str(self.CHAT_ID) in message
+
+    async def test_step3_remove_chat(self, mock_update, mock_context, workflow_session):
+        """Test removing the chat soft-deletes it."""
+        mock_context.args = [str(self.CHAT_ID)]
+        await remove_chat_command(mock_update, mock_context)
+        assert mock_update.message.reply_text.call_count == 1
+        assert CHAT_REMOVED in reply_text_of(mock_update)
+
+        # Verify chat is disabled
+        chat = ChatRepository(workflow_session).get_chat_by_id(self.CHAT_ID)
+        assert chat is not None
+        assert chat.enabled is False
 
 
 # Error handling tests
 
-@pytest.mark.asyncio
-@patch('src.handlers.admin_commands.get_db_session')
-async def test_add_chat_database_error(mock_get_db, mock_update, mock_context):
+async def test_add_chat_database_error(mock_update, mock_context, monkeypatch):
     """Test add_chat handles database errors gracefully."""
     # Setup - simulate database error
     mock_session = MagicMock()
     mock_session.commit.side_effect = Exception("Database error")
-    mock_get_db.return_value.__enter__.return_value = mock_session
+    monkeypatch.setattr(
+        'src.handlers.admin_commands.get_db_session',
+        lambda: nullcontext(mock_session)
+    )
 
     mock_context.args = ["-1001234", "Test"]
 
@@ -387,34 +380,31 @@ async def test_add_chat_database_error(mock_get_db, mock_update, mock_context):
 
     # Verify error message shown
     mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    assert "❌ Error adding chat" in call_args[0][0]
+    message = reply_text_of(mock_update)
+    assert "❌ Error adding chat" in message
 
 
-@pytest.mark.asyncio
-@patch('src.handlers.admin_commands.get_db_session')
-async def test_list_chats_database_error(mock_get_db, mock_update, mock_context):
+async def test_list_chats_database_error(mock_update, mock_context, monkeypatch):
     """Test list_chats handles database errors gracefully."""
     # Setup - simulate database error
-    mock_get_db.return_value.__enter__.side_effect = Exception("Database connection failed")
+    mock_get_db = MagicMock(side_effect=Exception("Database connection failed"))
+    monkeypatch.setattr('src.handlers.admin_commands.get_db_session', mock_get_db)
 
     # Execute
     await list_chats_command(mock_update, mock_context)
 
     # Verify error message shown
     mock_update.message.reply_text.assert_called_once()
-    call_args = mock_update.message.reply_text.call_args
-    assert "❌ Error listing chats" in call_args[0][0]
+    message = reply_text_of(mock_update)
+    assert "❌ Error listing chats" in message
 
 
 # Logging tests
 
-@pytest.mark.asyncio
 @patch('src.handlers.admin_commands.logger')
-@patch('src.handlers.admin_commands.get_db_session')
-async def test_add_chat_logs_admin_action(mock_get_db, mock_logger, mock_update, mock_context, db_session):
+@pytest.mark.usefixtures("patch_db_session")
+async def test_add_chat_logs_admin_action(mock_logger, mock_update, mock_context):
     """Test that add_chat logs admin actions."""
-    mock_get_db.return_value.__enter__.return_value = db_session
     mock_context.args = ["-1001234", "Test"]
 
     await add_chat_command(mock_update, mock_context)
@@ -1,15 +1,18 @@
 """Unit tests for admin authorization decorator."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 from telegram import Update, User, Message, Chat
 from telegram.ext import ContextTypes
 
 from src.decorators.authorization import admin_only
 from src.config.settings import Settings
 
+# Keep the module on one worker so its module-scoped fixtures are built once
+pytestmark = pytest.mark.xdist_group("admin_auth")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_settings():
     """Create mock settings with admin user ID."""
     settings = Settings(
@@ -20,25 +23,44 @@ def mock_settings():
     return settings
 
 
-@pytest.fixture
-def mock_update():
-    """Create mock Telegram update object."""
+@pytest.fixture(scope="module")
+def mock_user():
+    """Create mock Telegram user shared by the module."""
+    return MagicMock(spec=User)
+
+
+@pytest.fixture(scope="module")
+def mock_update(mock_user):
+    """Create mock Telegram update object shared by the module."""
     update = MagicMock(spec=Update)
-    update.effective_user = MagicMock(spec=User)
+    update.effective_user = mock_user
     update.message = MagicMock(spec=Message)
     update.message.reply_text = AsyncMock()
     return update
 
 
+@pytest.fixture(scope="module")
+def mock_context():
+    """Create mock context shared by the module."""
+    return MagicMock(spec=ContextTypes.DEFAULT_TYPE)
+
+
 @pytest.fixture
-def mock_context(mock_settings):
-    """Create mock context with settings in bot_data."""
-    context = MagicMock(spec=ContextTypes.DEFAULT_TYPE)
-    context.bot_data = {"settings": mock_settings}
-    return context
+def auth_logger(monkeypatch):
+    """Replace the decorator module logger with a mock."""
+    logger = MagicMock()
+    monkeypatch.setattr('src.decorators.authorization.logger', logger)
+    return logger
+
+
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_user, mock_update, mock_context, mock_settings):
+    """Restore default update/context state before each test."""
+    mock_update.effective_user = mock_user
+    mock_update.message.reply_text.reset_mock()
+    mock_context.bot_data = {"settings": mock_settings}
 
 
-@pytest.mark.asyncio
 async def test_admin_only_authorized_user(mock_update, mock_context, mock_settings):
     """Test that admin_only decorator allows authorized admin user."""
     # Set user_id to match admin_user_id
@@ -60,7 +82,6 @@ async def test_admin_only_authorized_user(mock_update, mock_context, mock_settin
     mock_update.message.reply_text.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_admin_only_unauthorized_user(mock_update, mock_context, mock_settings):
     """Test that admin_only decorator blocks unauthorized user."""
     # Set user_id to NOT match admin_user_id
@@ -84,7 +105,6 @@ async def test_admin_only_unauthorized_user(mock_update, mock_context, mock_sett
     )
 
 
-@pytest.mark.asyncio
 async def test_admin_only_missing_effective_user(mock_update, mock_context):
     """Test that decorator handles missing effective_user gracefully."""
     # Remove effective_user
@@ -105,7 +125,6 @@ async def test_admin_only_missing_effective_user(mock_update, mock_context):
     mock_update.message.reply_text.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_admin_only_missing_settings(mock_update, mock_context):
     """Test that decorator handles missing settings in bot_data."""
     # Remove settings from bot_data
@@ -129,7 +148,6 @@ async def test_admin_only_missing_settings(mock_update, mock_context):
     )
 
 
-@pytest.mark.asyncio
 async def test_admin_only_preserves_function_metadata():
     """Test that decorator preserves function metadata using functools.wraps."""
     @admin_only
@@ -142,7 +160,6 @@ async def test_admin_only_preserves_function_metadata():
     assert test_command_with_docstring.__doc__ == "This is a test command with documentation."
 
 
-@pytest.mark.asyncio
 async def test_admin_only_works_with_function_args(mock_update, mock_context, mock_settings):
     """Test that decorator works with functions that have additional arguments."""
     mock_update.effective_user.id = mock_settings.admin_user_id
@@ -159,8 +176,7 @@ async def test_admin_only_works_with_function_args(mock_update, mock_context, mo
     assert result == {"args": ("arg1", "arg2"), "kwargs": {"key": "value"}}
 
 
-@pytest.mark.asyncio
-async def test_admin_only_logging_on_unauthorized_access(mock_update, mock_context, mock_settings):
+async def test_admin_only_logging_on_unauthorized_access(mock_update, mock_context, auth_logger):
     """Test that unauthorized access attempts are logged."""
     mock_update.effective_user.id = 987654321  # Unauthorized user
 
@@ -169,19 +185,18 @@ async def test_admin_only_logging_on_unauthorized_access(mock_update, mock_conte
         """Test command handler."""
         return "success"
 
-    # Patch logger to verify logging
-    with patch('src.decorators.authorization.logger') as mock_logger:
-        await test_command(mock_update, mock_context)
+    await test_command(mock_update, mock_context)
 
-        # Assert warning was logged
-        assert mock_logger.warning.called
-        warning_message = mock_logger.warning.call_args[0][0]
-        assert "Unauthorized command access attempt" in warning_message
-        assert "user_id=987654321" in warning_message
+    # Assert warning was logged
+    assert auth_logger.warning.called
+    warning_message = auth_logger.warning.call_args[0][0]
+    assert "Unauthorized command access attempt" in warning_message
+    assert "user_id=987654321" in warning_message
 
 
-@pytest.mark.asyncio
-async def test_admin_only_logging_on_authorized_access(mock_update, mock_context, mock_settings):
+async def test_admin_only_logging_on_authorized_access(
+    mock_update, mock_context, mock_settings, auth_logger
+):
     """Test that authorized access is logged."""
     mock_update.effective_user.id = mock_settings.admin_user_id
 
@@ -190,12 +205,10 @@ async def test_admin_only_logging_on_authorized_access(mock_update, mock_context
         """Test command handler."""
         return "success"
 
-    # Patch logger to verify logging
-    with patch('src.decorators.authorization.logger') as mock_logger:
-        await test_command(mock_update, mock_context)
+    await test_command(mock_update, mock_context)
 
-        # Assert info log was created
-        assert mock_logger.info.called
-        info_message = mock_logger.info.call_args[0][0]
-        assert "Admin command authorized" in info_message
-        assert f"user_id={mock_settings.admin_user_id}" in info_message
+    # Assert info log was created
+    assert auth_logger.info.called
+    info_message = auth_logger.info.call_args[0][0]
+    assert "Admin command authorized" in info_message
+    assert f"user_id={mock_settings.admin_user_id}" in info_message
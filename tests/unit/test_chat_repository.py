@@ -2,24 +2,44 @@
 
 import pytest
 
-from src.repositories.chat_repository import ChatRepository
 from src.models.chat import Chat
 
+# Mix of enabled and disabled chats shared by the listing/status tests
+MIXED_STATUS_CHATS = (
+    dict(chat_id=111, chat_name="Enabled 1", enabled=True),
+    dict(chat_id=222, chat_name="Disabled", enabled=False),
+    dict(chat_id=333, chat_name="Enabled 2", enabled=True),
+)
+
+
+@pytest.fixture
+def mixed_status_chats(db_session):
+    """Seed the database with MIXED_STATUS_CHATS.
+
+    Args:
+        db_session: Database session fixture
+
+    Returns:
+        List of seeded Chat instances
+    """
+    chats = [Chat(**fields) for fields in MIXED_STATUS_CHATS]
+    db_session.add_all(chats)
+    db_session.flush()
+    return chats
+
 
 class TestChatRepository:
     """Test suite for ChatRepository."""
 
-    def test_save_chat(self, db_session, sample_chat):
+    def test_save_chat(self, chat_repo, sample_chat):
         """Test saving a chat to database.
 
         Args:
-            db_session: Database session fixture
+            chat_repo: Chat repository fixture
             sample_chat: Sample chat fixture
         """
-        repo = ChatRepository(db_session)
-
         # Save chat
-        saved = repo.save_chat(sample_chat)
+        saved = chat_repo.save_chat(sample_chat)
 
         # Verify
         assert saved.id is not None
@@ -27,152 +47,113 @@ class TestChatRepository:
         assert saved.chat_name == sample_chat.chat_name
         assert saved.enabled is True
 
-    def test_get_chat_by_id(self, db_session, sample_chat):
+    def test_get_chat_by_id(self, chat_repo, sample_chat):
         """Test retrieving chat by chat_id.
 
         Args:
-            db_session: Database session fixture
+            chat_repo: Chat repository fixture
             sample_chat: Sample chat fixture
         """
-        repo = ChatRepository(db_session)
-
         # Save and retrieve
-        repo.save_chat(sample_chat)
-        found = repo.get_chat_by_id(sample_chat.chat_id)
+        chat_repo.save_chat(sample_chat)
+        found = chat_repo.get_chat_by_id(sample_chat.chat_id)
 
         assert found is not None
         assert found.chat_id == sample_chat.chat_id
         assert found.chat_name == sample_chat.chat_name
 
-    def test_get_chat_by_id_not_found(self, db_session):
+    def test_get_chat_by_id_not_found(self, chat_repo):
         """Test retrieving non-existent chat returns None.
 
         Args:
-            db_session: Database session fixture
+            chat_repo: Chat repository fixture
         """
-        repo = ChatRepository(db_session)
-
-        found = repo.get_chat_by_id(99999)
+        found = chat_repo.get_chat_by_id(99999)
 
         assert found is None
 
-    def test_get_all_enabled_chats(self, db_session):
+    @pytest.mark.usefixtures("mixed_status_chats")
+    def test_get_all_enabled_chats(self, chat_repo):
         """Test retrieving only enabled chats.
 
         Args:
-            db_session: Database session fixture
+            chat_repo: Chat repository fixture
         """
-        repo = ChatRepository(db_session)
-
-        # Create mix of enabled and disabled chats
-        chats = [
-            Chat(chat_id=111, chat_name="Enabled 1", enabled=True),
-            Chat(chat_id=222, chat_name="Disabled", enabled=False),
-            Chat(chat_id=333, chat_name="Enabled 2", enabled=True),
-        ]
-
-        for chat in chats:
-            repo.save_chat(chat)
-
         # Get enabled chats
-        enabled = repo.get_all_enabled_chats()
+        enabled = chat_repo.get_all_enabled_chats()
 
         assert len(enabled) == 2
         assert all(chat.enabled for chat in enabled)
 
-    def test_get_all_chats(self, db_session):
+    @pytest.mark.usefixtures("mixed_status_chats")
+    def test_get_all_chats(self, chat_repo):
         """Test retrieving all chats regardless of status.
 
         Args:
-            db_session: Database session fixture
+            chat_repo: Chat repository fixture
         """
-        repo = ChatRepository(db_session)
-
-        # Create chats
-        chats = [
-            Chat(chat_id=111, chat_name="Chat 1", enabled=True),
-            Chat(chat_id=222, chat_name="Chat 2", enabled=False),
-        ]
-
-        for chat in chats:
-            repo.save_chat(chat)
-
         # Get all chats
-        all_chats = repo.get_all_chats()
+        all_chats = chat_repo.get_all_chats()
 
-        assert len(all_chats) == 2
+        assert len(all_chats) == len(MIXED_STATUS_CHATS)
 
-    def test_update_chat_enabled_status(self, db_session, sample_chat):
+    def test_update_chat_enabled_status(self, chat_repo, sample_chat):
         """Test updating chat enabled status.
 
         Args:
-            db_session: Database session fixture
+            chat_repo: Chat repository fixture
             sample_chat: Sample chat fixture
         """
-        repo = ChatRepository(db_session)
-
         # Save chat
-        repo.save_chat(sample_chat)
+        chat_repo.save_chat(sample_chat)
 
         # Update to disabled
-        updated = repo.update_chat_enabled_status(sample_chat.chat_id, False)
+        updated = chat_repo.update_chat_enabled_status(sample_chat.chat_id, False)
 
         assert updated is not None
         assert updated.enabled is False
 
         # Verify in database
-        found = repo.get_chat_by_id(sample_chat.chat_id)
+        found = chat_repo.get_chat_by_id(sample_chat.chat_id)
         assert found.enabled is False
 
-    def test_is_chat_enabled(self, db_session):
+    @pytest.mark.usefixtures("mixed_status_chats")
+    def test_is_chat_enabled(self, chat_repo):
         """Test checking if chat is enabled.
 
         Args:
-            db_session: Database session fixture
+            chat_repo: Chat repository fixture
         """
-        repo = ChatRepository(db_session)
-
-        # Create enabled and disabled chats
-        enabled_chat = Chat(chat_id=111, chat_name="Enabled", enabled=True)
-        disabled_chat = Chat(chat_id=222, chat_name="Disabled", enabled=False)
-
-        repo.save_chat(enabled_chat)
-        repo.save_chat(disabled_chat)
-
         # Check enabled status
-        assert repo.is_chat_enabled(111) is True
-        assert repo.is_chat_enabled(222) is False
-        assert repo.is_chat_enabled(999) is False  # Non-existent chat
+        assert chat_repo.is_chat_enabled(111) is True
+        assert chat_repo.is_chat_enabled(222) is False
+        assert chat_repo.is_chat_enabled(999) is False  # Non-existent chat
 
-    def test_delete_chat(self, db_session, sample_chat):
+    def test_delete_chat(self, chat_repo, sample_chat):
         """Test deleting a chat.
 
         Args:
-            db_session: Database session fixture
+            chat_repo: Chat repository fixture
             sample_chat: Sample chat fixture
         """
-        repo = ChatRepository(db_session)
-
         # Save chat
-        repo.save_chat(sample_chat)
+        chat_repo.save_chat(sample_chat)
 
         # Delete
-        result = repo.delete_chat(sample_chat.chat_id)
+        result = chat_repo.delete_chat(sample_chat.chat_id)
 
         assert result is True
 
         # Verify deleted
-        found = repo.get_chat_by_id(sample_chat.chat_id)
+        found = chat_repo.get_chat_by_id(sample_chat.chat_id)
         assert found is None
 
-    def test_delete_chat_not_found(self, db_session):
+    def test_delete_chat_not_found(self, chat_repo):
         """Test deleting non-existent chat returns False.
 
         Args:
-            db_session: Database session fixture
+            chat_repo: Chat repository fixture
         """
-        repo = ChatRepository(db_session)
-
-        result = repo.delete_chat(99999)
+        result = chat_repo.delete_chat(99999)
 
         assert result is False
@@ -0,0 +1,143 @@
+"""Unit tests for ClaudeAPIService."""
+
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from anthropic.types import TextBlock, ToolUseBlock
+
+from src.config.settings import Settings
+from src.models.message import Message
+from src.services.claude_api_service import ClaudeAPIService, SYSTEM_BLOCKS
+
+
+ANALYSIS_JSON = json.dumps({
+    "questions": [
+        {
+            "message_id": 1,
+            "text": "When will the report be ready?",
+            "category": "business",
+            "is_answered": True,
+            "answer_message_id": 2,
+            "response_time_minutes": 15.0,
+        }
+    ],
+    "answers": [],
+    "summary": {"total_questions": 1, "answered": 1, "unanswered": 0},
+})
+
+
+@pytest.fixture
+def claude_service():
+    """Create ClaudeAPIService with a mocked Anthropic client."""
+    service = ClaudeAPIService(Settings(
+        telegram_bot_token="test_token",
+        anthropic_api_key="test_key"
+    ))
+    service.client = MagicMock()
+    return service
+
+
+@pytest.fixture
+def sample_messages():
+    """Create sample messages for testing."""
+    return [
+        Message(
+            chat_id=1,
+            message_id=1,
+            user_id=100,
+            user_name="Alice",
+            text="When will the report be ready?",
+            timestamp=datetime(2025, 10, 24, 10, 0),
+        )
+    ]
+
+
+def _batch_entry(custom_id, result_type="succeeded", text=ANALYSIS_JSON):
+    """Build a batch results entry as returned by batches.results()."""
+    message = SimpleNamespace(content=[TextBlock(type="text", text=text)])
+    return SimpleNamespace(
+        custom_id=custom_id,
+        result=SimpleNamespace(type=result_type, message=message),
+    )
+
+
+class TestAnalyzeMessages:
+    """Tests for standard Messages API analysis."""
+
+    async def test_instructions_sent_as_system_prompt(
+        self, claude_service, sample_messages
+    ):
+        """Test static instructions go in the system prompt, messages in the user turn."""
+        claude_service.client.messages.create.return_value = SimpleNamespace(
+            content=[TextBlock(type="text", text=ANALYSIS_JSON)],
+        )
+
+        result = await claude_service.analyze_messages(sample_messages)
+
+        kwargs = claude_service.client.messages.create.call_args.kwargs
+        assert kwargs["system"] is SYSTEM_BLOCKS
+        user_prompt = kwargs["messages"][0]["content"]
+        assert "(ID: 1): When will the report be ready?" in user_prompt
+        assert SYSTEM_BLOCKS[0]["text"] not in user_prompt
+        assert result.summary.total_questions == 1
+
+    async def test_non_text_response_raises(self, claude_service, sample_messages):
+        """Test a response that does not start with a text block is rejected."""
+        claude_service.client.messages.create.return_value = SimpleNamespace(
+            content=[ToolUseBlock(type="tool_use", id="tool_1", name="lookup", input={})],
+        )
+
+        with pytest.raises(Exception, match="got tool_use"):
+            await claude_service.analyze_messages(sample_messages)
+
+
+class TestAnalyzeMessagesBatch:
+    """Tests for Message Batches API analysis."""
+
+    async def test_batch_results_keyed_by_custom_id(
+        self, claude_service, sample_messages, monkeypatch
+    ):
+        """Test each message list is submitted once and parsed by custom_id."""
+        monkeypatch.setattr(ClaudeAPIService, "BATCH_POLL_INTERVAL", 0)
+        batches = claude_service.client.messages.batches
+        batches.create.return_value = SimpleNamespace(id="batch_1", processing_status="in_progress")
+        batches.retrieve.return_value = SimpleNamespace(id="batch_1", processing_status="ended")
+        batches.results.return_value = iter([_batch_entry("AC-002")])
+
+        results = await claude_service.analyze_messages_batch({
+            "AC-002": sample_messages,
+            "empty": [],
+        })
+
+        requests = batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["AC-002"]
+        assert requests[0]["params"]["model"] == ClaudeAPIService.MODEL
+        assert requests[0]["params"]["system"] is SYSTEM_BLOCKS
+        batches.retrieve.assert_called_once_with("batch_1")
+        assert results["AC-002"].questions[0].answer_message_id == 2
+        assert results["empty"].summary.total_questions == 0
+
+    async def test_batch_request_error_raises(self, claude_service, sample_messages):
+        """Test a non-succeeded batch entry raises an exception."""
+        batches = claude_service.client.messages.batches
+        batches.create.return_value = SimpleNamespace(id="batch_1", processing_status="ended")
+        batches.results.return_value = iter([_batch_entry("AC-002", result_type="errored")])
+
+        with pytest.raises(Exception, match="AC-002 errored"):
+            await claude_service.analyze_messages_batch({"AC-002": sample_messages})
+
+    async def test_batch_timeout_raises(self, claude_service, sample_messages, monkeypatch):
+        """Test polling stops with an exception after claude_batch_max_wait."""
+        monkeypatch.setattr(ClaudeAPIService, "BATCH_POLL_INTERVAL", 0)
+        monkeypatch.setattr(claude_service.settings, "claude_batch_max_wait", 0)
+        batches = claude_service.client.messages.batches
+        batches.create.return_value = SimpleNamespace(id="batch_1", processing_status="in_progress")
+
+        with pytest.raises(Exception, match="did not finish"):
+            await claude_service.analyze_messages_batch({"AC-002": sample_messages})
+
+        batches.cancel.assert_called_once_with("batch_1")
+        batches.results.assert_not_called()
@@ -1,80 +1,71 @@
 """Unit tests for CleanupService."""
 
 import pytest
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 
 from src.services.cleanup_service import CleanupService
 from src.models.message import Message
 
+# Keep the module on one worker so its module-scoped fixtures are built once
+pytestmark = pytest.mark.xdist_group("cleanup")
+
+
+@pytest.fixture(scope="module")
+def cleanup_service():
+    """Create one CleanupService with 48h retention for the module."""
+    with patch('src.services.cleanup_service.get_settings') as mock_settings:
+        mock_settings.return_value = MagicMock(message_retention_hours=48)
+        yield CleanupService()
+
 
 class TestCleanupService:
     """Test suite for CleanupService."""
 
-    @patch('src.services.cleanup_service.get_db_session')
-    @patch('src.services.cleanup_service.get_settings')
-    def test_cleanup_old_messages_success(
-        self,
-        mock_settings,
-        mock_get_session
-    ):
+    def test_cleanup_old_messages_success(self, cleanup_service, monkeypatch):
         """Test successful cleanup of old messages.
 
         Args:
-            mock_settings: Mock settings
-            mock_get_session: Mock database session
+            cleanup_service: Shared cleanup service
+            monkeypatch: Pytest monkeypatch fixture
         """
         # Setup mocks
-        mock_settings_instance = MagicMock()
-        mock_settings_instance.message_retention_hours = 48
-        mock_settings.return_value = mock_settings_instance
-
-        mock_session = MagicMock()
         mock_repo = MagicMock()
         mock_repo.delete_old_messages.return_value = 10  # 10 messages deleted
 
-        mock_get_session.return_value.__enter__.return_value = mock_session
-
-        # Create service
-        service = CleanupService()
-
-        with patch(
+        monkeypatch.setattr(
+            'src.services.cleanup_service.get_db_session',
+            lambda: nullcontext(MagicMock())
+        )
+        monkeypatch.setattr(
             'src.services.cleanup_service.MessageRepository',
-            return_value=mock_repo
-        ):
-            # Run cleanup
-            deleted_count = service.cleanup_old_messages()
+            MagicMock(return_value=mock_repo)
+        )
+
+        # Run cleanup
+        deleted_count = cleanup_service.cleanup_old_messages()
 
         # Verify
         assert deleted_count == 10
         mock_repo.delete_old_messages.assert_called_once()
 
-    @patch('src.services.cleanup_service.get_db_session')
-    @patch('src.services.cleanup_service.get_settings')
-    def test_cleanup_old_messages_error_handling(
-        self,
-        mock_settings,
-        mock_get_session
-    ):
+    def test_cleanup_old_messages_error_handling(self, cleanup_service, monkeypatch):
         """Test cleanup handles errors gracefully.
 
         Args:
-            mock_settings: Mock settings
-            mock_get_session: Mock database session
+            cleanup_service: Shared cleanup service
+            monkeypatch: Pytest monkeypatch fixture
         """
-        # Setup mocks
-        mock_settings_instance = MagicMock()
-        mock_settings_instance.message_retention_hours = 48
-        mock_settings.return_value = mock_settings_instance
-
         # Simulate error
-        mock_get_session.return_value.__enter__.side_effect = Exception("DB Error")
-
-        # Create service
-        service = CleanupService()
+        mock_get_session = MagicMock(side_effect=Exception("DB Error"))
+        monkeypatch.setattr(
+            'src.services.cleanup_service.get_db_session',
+            mock_get_session
+        )
 
         # Run cleanup (should not raise, returns 0)
-        deleted_count = service.cleanup_old_messages()
+        deleted_count = cleanup_service.cleanup_old_messages()
 
         # Verify error handled
         assert deleted_count == 0
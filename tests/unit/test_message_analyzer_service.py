@@ -2,23 +2,46 @@
 
 import pytest
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+from sqlalchemy.orm import Session
+
+from src.config.settings import Settings
 from src.services.message_analyzer_service import MessageAnalyzerService
 from src.services.claude_api_service import AnalysisResult, AnalysisSummary, QuestionAnalysis
 from src.models.message import Message
+from src.repositories.message_repository import MessageRepository
+
+
+PERIOD_START = datetime(2025, 10, 24, 0, 0, tzinfo=timezone.utc)
+PERIOD_END = datetime(2025, 10, 24, 23, 59, tzinfo=timezone.utc)
+
+API_ERROR = RuntimeError("API Error")
+
+# (analyzer method, repository method it reads from, extra call kwargs)
+ANALYSIS_ENTRY_POINTS = (
+    "method,repo_method,kwargs",
+    [
+        ("analyze_chat_last_24h", "get_messages_since", {}),
+        (
+            "analyze_custom_period",
+            "get_messages_between",
+            {"start_time": PERIOD_START, "end_time": PERIOD_END},
+        ),
+    ],
+)
 
 
 @pytest.fixture
 def mock_session():
     """Create mock database session."""
-    return MagicMock()
+    return Mock(spec=Session)
 
 
 @pytest.fixture
 def mock_settings():
     """Create mock settings."""
-    settings = MagicMock()
+    settings = Mock(spec=Settings)
     settings.anthropic_api_key = "test-key"
     return settings
 
@@ -80,7 +103,6 @@ def sample_analysis_result():
 class TestMessageAnalyzerService:
     """Tests for MessageAnalyzerService."""
 
-    @pytest.mark.asyncio
     async def test_analyze_chat_last_24h_success(
         self, analyzer_service, sample_messages, sample_analysis_result
     ):
@@ -96,7 +118,8 @@ class TestMessageAnalyzerService:
         )
 
         # Execute analysis
-        result = await analyzer_service.analyze_chat_last_24h(chat_id=1)
+        now = datetime(2025, 10, 24, 12, 0, tzinfo=timezone.utc)
+        result = await analyzer_service.analyze_chat_last_24h(chat_id=1, now=now)
 
         # Verify
         assert result is not None
@@ -105,59 +128,20 @@ class TestMessageAnalyzerService:
         assert result.summary.unanswered == 0
 
         # Verify message_repo called with correct time window
-        analyzer_service.message_repo.get_messages_since.assert_called_once()
-        call_args = analyzer_service.message_repo.get_messages_since.call_args
-        assert call_args[0][0] == 1  # chat_id
+        analyzer_service.message_repo.get_messages_since.assert_called_once_with(
+            1, now - timedelta(hours=24)
+        )
 
         # Verify Claude service called
         analyzer_service.claude_service.analyze_messages.assert_awaited_once_with(
             sample_messages
         )
 
-    @pytest.mark.asyncio
-    async def test_analyze_chat_last_24h_no_messages(self, analyzer_service):
-        """Test analysis when no messages found."""
-        # Mock empty message list
-        analyzer_service.message_repo.get_messages_since = MagicMock(return_value=[])
-
-        # Mock Claude service (should not be called)
-        analyzer_service.claude_service.analyze_messages = AsyncMock()
-
-        # Execute analysis
-        result = await analyzer_service.analyze_chat_last_24h(chat_id=1)
-
-        # Verify returns None
-        assert result is None
-
-        # Verify Claude service not called
-        analyzer_service.claude_service.analyze_messages.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_analyze_chat_last_24h_api_error(
-        self, analyzer_service, sample_messages
-    ):
-        """Test handling of Claude API errors."""
-        # Mock message repository
-        analyzer_service.message_repo.get_messages_since = MagicMock(
-            return_value=sample_messages
-        )
-
-        # Mock Claude service to raise error
-        analyzer_service.claude_service.analyze_messages = AsyncMock(
-            side_effect=Exception("API Error")
-        )
-
-        # Execute and verify exception propagates
-        with pytest.raises(Exception, match="API Error"):
-            await analyzer_service.analyze_chat_last_24h(chat_id=1)
-
-    @pytest.mark.asyncio
     async def test_analyze_custom_period_success(
         self, analyzer_service, sample_messages, sample_analysis_result
     ):
         """Test successful analysis for custom time period."""
-        start_time = datetime(2025, 10, 24, 0, 0, tzinfo=timezone.utc)
-        end_time = datetime(2025, 10, 24, 23, 59, tzinfo=timezone.utc)
+        start_time, end_time = PERIOD_START, PERIOD_END
 
         # Mock message repository
         analyzer_service.message_repo.get_messages_between = MagicMock(
@@ -186,22 +170,19 @@ class TestMessageAnalyzerService:
         # Verify Claude service called
         analyzer_service.claude_service.analyze_messages.assert_awaited_once()
 
-    @pytest.mark.asyncio
-    async def test_analyze_custom_period_no_messages(self, analyzer_service):
-        """Test custom period analysis when no messages found."""
-        start_time = datetime(2025, 10, 24, 0, 0, tzinfo=timezone.utc)
-        end_time = datetime(2025, 10, 24, 23, 59, tzinfo=timezone.utc)
-
+    @pytest.mark.parametrize(*ANALYSIS_ENTRY_POINTS)
+    async def test_analysis_no_messages(
+        self, analyzer_service, method, repo_method, kwargs
+    ):
+        """Test analysis returns None when no messages found."""
         # Mock empty message list
-        analyzer_service.message_repo.get_messages_between = MagicMock(return_value=[])
+        setattr(analyzer_service.message_repo, repo_method, MagicMock(return_value=[]))
 
         # Mock Claude service (should not be called)
         analyzer_service.claude_service.analyze_messages = AsyncMock()
 
         # Execute analysis
-        result = await analyzer_service.analyze_custom_period(
-            chat_id=1, start_time=start_time, end_time=end_time
-        )
+        result = await getattr(analyzer_service, method)(chat_id=1, **kwargs)
 
         # Verify returns None
         assert result is None
@@ -209,26 +190,49 @@ class TestMessageAnalyzerService:
         # Verify Claude service not called
         analyzer_service.claude_service.analyze_messages.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_analyze_custom_period_api_error(
-        self, analyzer_service, sample_messages
+    @pytest.mark.parametrize(*ANALYSIS_ENTRY_POINTS)
+    async def test_analysis_api_error(
+        self, analyzer_service, sample_messages, method, repo_method, kwargs
     ):
-        """Test handling of API errors in custom period analysis."""
-        start_time = datetime(2025, 10, 24, 0, 0, tzinfo=timezone.utc)
-        end_time = datetime(2025, 10, 24, 23, 59, tzinfo=timezone.utc)
-
+        """Test handling of Claude API errors."""
         # Mock message repository
-        analyzer_service.message_repo.get_messages_between = MagicMock(
-            return_value=sample_messages
+        setattr(
+            analyzer_service.message_repo,
+            repo_method,
+            MagicMock(return_value=sample_messages)
         )
 
         # Mock Claude service to raise error
         analyzer_service.claude_service.analyze_messages = AsyncMock(
-            side_effect=Exception("API Error")
+            side_effect=API_ERROR
         )
 
         # Execute and verify exception propagates
-        with pytest.raises(Exception, match="API Error"):
-            await analyzer_service.analyze_custom_period(
-                chat_id=1, start_time=start_time, end_time=end_time
-            )
+        with pytest.raises(RuntimeError, match="API Error"):
+            await getattr(analyzer_service, method)(chat_id=1, **kwargs)
+
+    async def test_analyze_chat_last_24h_is_single_query(
+        self, db_session, mock_settings, sample_messages, sample_analysis_result,
+        executed_statements
+    ):
+        """Test 24h analysis fetches plain message rows with exactly one SELECT."""
+        MessageRepository(db_session).save_messages(sample_messages)
+        analyzer = MessageAnalyzerService(db_session, mock_settings)
+        analyzer.claude_service.analyze_messages = AsyncMock(
+            return_value=sample_analysis_result
+        )
+        executed_statements.clear()
+
+        await analyzer.analyze_chat_last_24h(chat_id=1)
+
+        # Rows carry every field the prompt builder reads
+        messages = analyzer.claude_service.analyze_messages.call_args[0][0]
+        analyzer.claude_service._build_analysis_prompt(messages)
+
+        selects = [
+            statement for statement, _ in executed_statements
+            if statement.lstrip().upper().startswith("SELECT")
+        ]
+        assert len(selects) == 1
+        assert [msg.message_id for msg in messages] == [1, 2]
+        assert not any(isinstance(msg, Message) for msg in messages)
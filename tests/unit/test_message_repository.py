@@ -1,10 +1,14 @@
 """Unit tests for MessageRepository."""
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from src.repositories.message_repository import MessageRepository
 from src.models.message import Message
+from tests.fixtures.message_rows import MessageRow
+
+# Reference time shared by every test in this module
+NOW = datetime.now(timezone.utc)
 
 
 class TestMessageRepository:
@@ -28,53 +32,101 @@ class TestMessageRepository:
         assert saved.message_id == sample_message.message_id
         assert saved.text == sample_message.text
 
-    def test_get_messages_last_24h(self, db_session):
-        """Test retrieving messages from last 24 hours.
+    def test_save_messages(self, db_session):
+        """Test saving several messages at once.
 
         Args:
             db_session: Database session fixture
         """
         repo = MessageRepository(db_session)
-        chat_id = 12345678
-
-        # Create messages at different times
-        now = datetime.now()
         messages = [
             Message(
-                chat_id=chat_id,
-                message_id=1,
-                user_id=1,
-                user_name="User 1",
-                text="Recent message",
-                timestamp=now - timedelta(hours=2)
-            ),
-            Message(
-                chat_id=chat_id,
-                message_id=2,
-                user_id=1,
-                user_name="User 1",
-                text="Old message",
-                timestamp=now - timedelta(hours=30)
-            ),
-            Message(
-                chat_id=chat_id,
-                message_id=3,
+                chat_id=111,
+                message_id=message_id,
                 user_id=1,
                 user_name="User 1",
-                text="Very recent",
-                timestamp=now - timedelta(minutes=5)
+                text=f"Message {message_id}",
+                timestamp=NOW
             )
+            for message_id in (1, 2)
+        ]
+
+        saved = repo.save_messages(messages)
+
+        assert all(msg.id is not None for msg in saved)
+        assert repo.count_messages(chat_id=111) == 2
+
+    def test_get_messages_last_24h(self, db_session, seed_messages):
+        """Test retrieving messages from last 24 hours.
+
+        Args:
+            db_session: Database session fixture
+            seed_messages: Bulk message insert fixture
+        """
+        repo = MessageRepository(db_session)
+        chat_id = 12345678
+
+        # Create messages at different times
+        rows = [
+            MessageRow(chat_id, 1, "Recent message", NOW - timedelta(hours=2)),
+            MessageRow(chat_id, 2, "Old message", NOW - timedelta(hours=30)),
+            MessageRow(chat_id, 3, "Very recent", NOW - timedelta(minutes=5)),
         ]
 
-        for msg in messages:
-            repo.save_message(msg)
+        seed_messages(rows)
 
         # Get messages from last 24h
         recent = repo.get_messages_last_24h(chat_id)
 
         # Should only include messages 1 and 3
         assert len(recent) == 2
-        assert all(msg.timestamp >= now - timedelta(hours=24) for msg in recent)
+        assert {msg.message_id for msg in recent} == {1, 3}
+
+    def test_get_messages_last_24h_uses_chat_timestamp_index(
+        self, db_session, executed_statements
+    ):
+        """Test the 24h query is a range scan on idx_chat_timestamp.
+
+        Args:
+            db_session: Database session fixture
+            executed_statements: Recorded SQL statements fixture
+        """
+        repo = MessageRepository(db_session)
+
+        repo.get_messages_last_24h(12345678)
+
+        statement, parameters = executed_statements[-1]
+        plan = db_session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).all()
+
+        assert any("USING INDEX idx_chat_timestamp" in row[-1] for row in plan)
+
+    def test_get_messages_since_and_between(self, db_session, seed_messages):
+        """Test time-window queries return chat messages in chronological order.
+
+        Args:
+            db_session: Database session fixture
+            seed_messages: Bulk message insert fixture
+        """
+        repo = MessageRepository(db_session)
+        seed_messages([
+            MessageRow(
+                chat_id, message_id, f"{hours_ago} hours old",
+                NOW - timedelta(hours=hours_ago)
+            )
+            for chat_id, message_id, hours_ago in (
+                (111, 1, 1), (111, 2, 5), (111, 3, 30), (222, 1, 2)
+            )
+        ])
+
+        since = repo.get_messages_since(111, NOW - timedelta(hours=24))
+        between = repo.get_messages_between(
+            111, NOW - timedelta(hours=48), NOW - timedelta(hours=3)
+        )
+
+        assert [msg.message_id for msg in since] == [2, 1]
+        assert [msg.message_id for msg in between] == [3, 2]
 
     def test_get_message_by_id(self, db_session, sample_message):
         """Test retrieving message by chat_id and message_id.
@@ -110,51 +162,41 @@ class TestMessageRepository:
 
         assert found is None
 
-    def test_delete_old_messages(self, db_session):
+    def test_delete_old_messages(
+        self, db_session, seed_messages, executed_statements
+    ):
         """Test deleting messages older than cutoff date.
 
         Args:
             db_session: Database session fixture
+            seed_messages: Bulk message insert fixture
+            executed_statements: Recorded SQL statements fixture
         """
         repo = MessageRepository(db_session)
         chat_id = 12345678
-        now = datetime.now()
 
         # Create messages at different ages
-        messages = [
-            Message(
-                chat_id=chat_id,
-                message_id=1,
-                user_id=1,
-                user_name="User 1",
-                text="10 hours old",
-                timestamp=now - timedelta(hours=10)
-            ),
-            Message(
-                chat_id=chat_id,
-                message_id=2,
-                user_id=1,
-                user_name="User 1",
-                text="30 hours old",
-                timestamp=now - timedelta(hours=30)
-            ),
-            Message(
-                chat_id=chat_id,
-                message_id=3,
-                user_id=1,
-                user_name="User 1",
-                text="50 hours old",
-                timestamp=now - timedelta(hours=50)
-            )
+        rows = [
+            MessageRow(chat_id, 1, "10 hours old", NOW - timedelta(hours=10)),
+            MessageRow(chat_id, 2, "30 hours old", NOW - timedelta(hours=30)),
+            MessageRow(chat_id, 3, "50 hours old", NOW - timedelta(hours=50)),
         ]
 
-        for msg in messages:
-            repo.save_message(msg)
+        seed_messages(rows)
 
         # Delete messages older than 48 hours
-        cutoff = now - timedelta(hours=48)
+        cutoff = NOW - timedelta(hours=48)
+        executed_statements.clear()
         deleted_count = repo.delete_old_messages(cutoff)
 
+        # Should run as one DELETE with no SELECT of the affected rows
+        verbs = [
+            statement.lstrip().split(None, 1)[0].upper()
+            for statement, _ in executed_statements
+        ]
+        assert verbs.count("DELETE") == 1
+        assert "SELECT" not in verbs
+
         # Should delete 1 message (50 hours old)
         assert deleted_count == 1
 
@@ -162,44 +204,23 @@ class TestMessageRepository:
         remaining = db_session.query(Message).count()
         assert remaining == 2
 
-    def test_count_messages(self, db_session):
+    def test_count_messages(self, db_session, seed_messages):
         """Test counting messages with optional chat filter.
 
         Args:
             db_session: Database session fixture
+            seed_messages: Bulk message insert fixture
         """
         repo = MessageRepository(db_session)
 
         # Create messages in different chats
-        messages = [
-            Message(
-                chat_id=111,
-                message_id=1,
-                user_id=1,
-                user_name="User 1",
-                text="Chat 111",
-                timestamp=datetime.now()
-            ),
-            Message(
-                chat_id=111,
-                message_id=2,
-                user_id=1,
-                user_name="User 1",
-                text="Chat 111 again",
-                timestamp=datetime.now()
-            ),
-            Message(
-                chat_id=222,
-                message_id=1,
-                user_id=1,
-                user_name="User 1",
-                text="Chat 222",
-                timestamp=datetime.now()
-            )
+        rows = [
+            MessageRow(111, 1, "Chat 111", NOW),
+            MessageRow(111, 2, "Chat 111 again", NOW),
+            MessageRow(222, 1, "Chat 222", NOW),
         ]
 
-        for msg in messages:
-            repo.save_message(msg)
+        seed_messages(rows)
 
         # Count all messages
         total = repo.count_messages()
@@ -221,8 +242,12 @@ class TestMessageRepository:
         # Save message with reactions
         saved = repo.save_message(sample_message_with_reactions)
 
-        # Retrieve and check reactions
-        found = repo.get_message_by_id(saved.chat_id, saved.message_id)
-        reactions = found.get_reactions()
+        # save_message() refreshes the row, so reactions are as stored
+        reactions = saved.get_reactions()
 
         assert reactions == {"❤️": 5, "👍": 3, "💩": 1}
+        assert saved.get_reactions() is reactions
+
+        # Updating reactions invalidates the cached dictionary
+        saved.set_reactions({"👍": 4})
+        assert saved.get_reactions() == {"👍": 4}
@@ -11,18 +11,21 @@ from src.services.claude_api_service import (
 )
 from src.services.report_generator_service import ReportGeneratorService
 
+REPORT_DATE = date(2025, 10, 24)
+CHAT_NAME = "Test Chat"
+
 
 class TestReportGeneratorService:
     """Test cases for ReportGeneratorService."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def service(self):
-        """Create ReportGeneratorService instance."""
+        """Create ReportGeneratorService instance (stateless, shared)."""
         return ReportGeneratorService()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_analysis(self):
-        """Create sample analysis result for testing."""
+        """Create sample analysis result shared by read-only report tests."""
         return AnalysisResult(
             questions=[
                 QuestionAnalysis(
@@ -68,93 +71,81 @@ class TestReportGeneratorService:
             ),
         )
 
-    def test_categorize_response_time_fast(self, service):
-        """Test response time categorization - fast (<1h)."""
-        assert service._categorize_response_time(30) == "Fast response (<1h)"
-        assert service._categorize_response_time(59) == "Fast response (<1h)"
-
-    def test_categorize_response_time_medium(self, service):
-        """Test response time categorization - medium (1-4h)."""
-        assert service._categorize_response_time(60) == "Medium response (1-4h)"
-        assert service._categorize_response_time(120) == "Medium response (1-4h)"
-        assert service._categorize_response_time(239) == "Medium response (1-4h)"
-
-    def test_categorize_response_time_slow(self, service):
-        """Test response time categorization - slow (4-24h)."""
-        assert service._categorize_response_time(240) == "Slow response (4-24h)"
-        assert service._categorize_response_time(720) == "Slow response (4-24h)"
-        assert service._categorize_response_time(1439) == "Slow response (4-24h)"
-
-    def test_categorize_response_time_very_slow(self, service):
-        """Test response time categorization - very slow (>24h)."""
-        assert service._categorize_response_time(1440) == "Very slow response (>24h)"
-        assert service._categorize_response_time(2000) == "Very slow response (>24h)"
-
-    def test_categorize_response_time_unanswered(self, service):
-        """Test response time categorization - unanswered."""
-        assert service._categorize_response_time(None) == "Unanswered"
-
-    def test_format_duration_minutes(self, service):
-        """Test duration formatting - minutes only."""
-        assert service._format_duration(30) == "30m"
-        assert service._format_duration(59) == "59m"
-
-    def test_format_duration_hours(self, service):
-        """Test duration formatting - hours."""
-        assert service._format_duration(60) == "1h"
-        assert service._format_duration(120) == "2h"
-
-    def test_format_duration_hours_minutes(self, service):
-        """Test duration formatting - hours and minutes."""
-        assert service._format_duration(90) == "1h 30m"
-        assert service._format_duration(135) == "2h 15m"
-
-    def test_format_report_structure(self, service, sample_analysis):
-        """Test that generated report has all required sections."""
-        report = service.format_report(
-            sample_analysis, "Test Chat", date(2025, 10, 24)
+    @pytest.fixture(scope="module")
+    def formatted_report(self, service, sample_analysis):
+        """Format the sample analysis once for the read-only report tests."""
+        return service.format_report(
+            sample_analysis, CHAT_NAME, REPORT_DATE
         )
 
+    @pytest.mark.parametrize("minutes,expected", [
+        (30, "Fast response (<1h)"),
+        (59, "Fast response (<1h)"),
+        (60, "Medium response (1-4h)"),
+        (120, "Medium response (1-4h)"),
+        (239, "Medium response (1-4h)"),
+        (240, "Slow response (4-24h)"),
+        (720, "Slow response (4-24h)"),
+        (1439, "Slow response (4-24h)"),
+        (1440, "Very slow response (>24h)"),
+        (2000, "Very slow response (>24h)"),
+        (None, "Unanswered"),
+    ])
+    def test_categorize_response_time(self, service, minutes, expected):
+        """Test response time categorization across bucket boundaries."""
+        assert service._categorize_response_time(minutes) == expected
+
+    @pytest.mark.parametrize("minutes,expected", [
+        (30, "30m"),
+        (59, "59m"),
+        (60, "1h"),
+        (120, "2h"),
+        (90, "1h 30m"),
+        (135, "2h 15m"),
+    ])
+    def test_format_duration(self, service, minutes, expected):
+        """Test duration formatting for minutes, hours and both."""
+        assert service._format_duration(minutes) == expected
+
+    def test_format_report_structure(self, formatted_report):
+        """Test that generated report has all required sections."""
         # Check all required sections are present
-        assert "# Daily Communication Report #IMFReport" in report
-        assert "**Chat:** Test Chat" in report
-        assert "**Date:** 2025-10-24" in report
-        assert "## Summary" in report
-        assert "## Response Time Breakdown" in report
-        assert "## Unanswered Questions" in report
-        assert "## Top Reactions" in report
-
-    def test_format_report_summary_stats(self, service, sample_analysis):
+        lines = set(formatted_report.splitlines())
+        expected = [
+            "# Daily Communication Report #IMFReport",
+            f"**Chat:** {CHAT_NAME}",
+            f"**Date:** {REPORT_DATE.isoformat()}",
+            "## Summary",
+            "## Response Time Breakdown",
+            "## Unanswered Questions",
+            "## Top Reactions",
+        ]
+        missing = [line for line in expected if line not in lines]
+        assert not missing
+
+    def test_format_report_summary_stats(self, formatted_report):
         """Test that summary section contains correct statistics."""
-        report = service.format_report(
-            sample_analysis, "Test Chat", date(2025, 10, 24)
-        )
-
-        assert "**Total Questions:** 3" in report
-        assert "**Answered:** 2" in report
-        assert "**Unanswered:** 1" in report
-        assert "1h 15m" in report  # avg response time
+        assert "**Total Questions:** 3" in formatted_report
+        assert "**Answered:** 2" in formatted_report
+        assert "**Unanswered:** 1" in formatted_report
+        assert "1h 15m" in formatted_report  # avg response time
 
-    def test_format_report_response_time_breakdown(self, service, sample_analysis):
+    def test_format_report_response_time_breakdown(self, formatted_report):
         """Test response time breakdown section."""
-        report = service.format_report(
-            sample_analysis, "Test Chat", date(2025, 10, 24)
-        )
-
-        assert "**Fast (<1h):** 1" in report  # 30 min question
-        assert "**Medium (1-4h):** 1" in report  # 120 min question
-        assert "**Slow (4-24h):** 0" in report
-        assert "**Very Slow (>24h):** 0" in report
-
-    def test_format_report_unanswered_questions(self, service, sample_analysis):
+        expected = [
+            "**Fast (<1h):** 1",  # 30 min question
+            "**Medium (1-4h):** 1",  # 120 min question
+            "**Slow (4-24h):** 0",
+            "**Very Slow (>24h):** 0",
+        ]
+        missing = [text for text in expected if text not in formatted_report]
+        assert not missing
+
+    def test_format_report_unanswered_questions(self, formatted_report):
         """Test unanswered questions section."""
-        report = service.format_report(
-            sample_analysis, "Test Chat", date(2025, 10, 24)
-        )
-
-        assert "## Unanswered Questions" in report
-        assert "Can someone help?" in report
-        assert "❓ Other" in report  # category badge
+        assert "## Unanswered Questions" in formatted_report
+        assert "Can someone help?" in formatted_report
+        assert "❓ Other" in formatted_report  # category badge
 
     def test_format_report_all_answered(self, service):
         """Test report when all questions are answered."""
@@ -182,7 +173,7 @@ class TestReportGeneratorService:
             ),
         )
 
-        report = service.format_report(analysis, "Test Chat", date(2025, 10, 24))
+        report = service.format_report(analysis, CHAT_NAME, REPORT_DATE)
 
         assert "All questions have been answered!" in report
 
@@ -199,7 +190,7 @@ class TestReportGeneratorService:
             ),
         )
 
-        report = service.format_report(analysis, "Test Chat", date(2025, 10, 24))
+        report = service.format_report(analysis, CHAT_NAME, REPORT_DATE)
 
         assert "**Total Questions:** 0" in report
         assert "All questions have been answered!" in report
@@ -223,8 +214,7 @@ class TestReportGeneratorService:
             ),
         )
 
-        report = service.format_report(analysis, "Test Chat", date(2025, 10, 24))
+        report = service.format_report(analysis, CHAT_NAME, REPORT_DATE)
 
         # Check that special characters are escaped
-        assert "\\*this\\*" in report or "*this*" not in report
-        assert "\\_thing\\_" in report or "_thing_" not in report
+        assert "What is \\*this\\* \\_thing\\_?" in report
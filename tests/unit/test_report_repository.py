@@ -2,55 +2,136 @@
 
 from datetime import date, datetime, timedelta
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
-from src.models.base import Base
 from src.models.chat import Chat
 from src.models.report import Report
 from src.repositories.report_repository import ReportRepository
 
+REPORT_DATE = date(2025, 10, 24)
+CHAT_NAME = "Test Chat"
+
+
+@pytest.fixture(scope="class")
+def class_connection(shared_db_engine):
+    """Open a connection whose outer transaction spans a test class.
+
+    Args:
+        shared_db_engine: Session-scoped database engine fixture
+
+    Yields:
+        Connection rolled back after the class
+    """
+    connection = shared_db_engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="class")
+def test_chat(class_connection):
+    """Create test chat once per class in the outer transaction.
+
+    Args:
+        class_connection: Class-scoped connection fixture
+
+    Returns:
+        Chat row shared by the tests of the class
+    """
+    with Session(
+        bind=class_connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False
+    ) as session:
+        chat = Chat(chat_id=123456, chat_name=CHAT_NAME, enabled=True)
+        session.add(chat)
+        session.commit()
+    return chat
+
 
 @pytest.fixture
-def engine():
-    """Create in-memory SQLite engine for testing."""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    return engine
+def db_session(class_connection):
+    """Create a per-test session inside a SAVEPOINT on the class connection.
+
+    Overrides the conftest fixture so reports written by a test are rolled
+    back while the class-scoped test_chat survives.
+
+    Args:
+        class_connection: Class-scoped connection fixture
+
+    Yields:
+        SQLAlchemy session
+    """
+    savepoint = class_connection.begin_nested()
+    session = Session(bind=class_connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        savepoint.rollback()
+
+
+@pytest.fixture(scope="class")
+def seeded_report(class_connection, test_chat):
+    """Create one report per class for the read-only tests.
+
+    Args:
+        class_connection: Class-scoped connection fixture
+        test_chat: Class-scoped chat fixture
+
+    Returns:
+        Report row shared by the tests of the class
+    """
+    with Session(
+        bind=class_connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False
+    ) as session:
+        report = Report(
+            chat_id=test_chat.id, report_date=REPORT_DATE, questions_count=7
+        )
+        session.add(report)
+        session.commit()
+    return report
 
 
-@pytest.fixture
-def session(engine):
-    """Create database session for testing."""
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    yield session
-    session.close()
+@pytest.fixture(scope="class")
+def read_repository(class_connection, seeded_report):
+    """Create a ReportRepository shared by read-only tests.
 
+    The tests using it never write, so no per-test SAVEPOINT is needed.
 
-@pytest.fixture
-def test_chat(session):
-    """Create test chat."""
-    chat = Chat(chat_id=123456, chat_name="Test Chat", enabled=True)
-    session.add(chat)
-    session.commit()
-    return chat
+    Args:
+        class_connection: Class-scoped connection fixture
+        seeded_report: Class-scoped report fixture
+
+    Yields:
+        ReportRepository bound to the class connection
+    """
+    session = Session(bind=class_connection, join_transaction_mode="create_savepoint")
+    yield ReportRepository(session)
+    session.close()
 
 
 @pytest.fixture
-def repository(session):
-    """Create ReportRepository instance."""
-    return ReportRepository(session)
+def repository(db_session):
+    """Create ReportRepository instance.
+
+    Depends only on db_session so the not-found tests do not seed a chat.
+    """
+    return ReportRepository(db_session)
 
 
 class TestReportRepository:
-    """Test cases for ReportRepository."""
+    """Test cases for ReportRepository that write or need no seeded report."""
 
     def test_create_report(self, repository, test_chat):
         """Test creating a new report."""
         report = repository.create(
             chat_id=test_chat.id,
-            report_date=date(2025, 10, 24),
+            report_date=REPORT_DATE,
             questions_count=10,
             answered_count=8,
             unanswered_count=2,
@@ -60,7 +141,7 @@ class TestReportRepository:
 
         assert report.id is not None
         assert report.chat_id == test_chat.id
-        assert report.report_date == date(2025, 10, 24)
+        assert report.report_date == REPORT_DATE
         assert report.questions_count == 10
         assert report.answered_count == 8
         assert report.unanswered_count == 2
@@ -72,65 +153,30 @@ class TestReportRepository:
     def test_create_minimal_report(self, repository, test_chat):
         """Test creating report with minimal required fields."""
         report = repository.create(
-            chat_id=test_chat.id, report_date=date(2025, 10, 24)
+            chat_id=test_chat.id, report_date=REPORT_DATE
         )
 
         assert report.id is not None
         assert report.chat_id == test_chat.id
-        assert report.report_date == date(2025, 10, 24)
+        assert report.report_date == REPORT_DATE
         assert report.questions_count is None
         assert report.report_content is None
 
-    def test_get_by_id(self, repository, test_chat):
-        """Test retrieving report by ID."""
-        created = repository.create(
-            chat_id=test_chat.id,
-            report_date=date(2025, 10, 24),
-            questions_count=5,
-        )
-
-        retrieved = repository.get_by_id(created.id)
-
-        assert retrieved is not None
-        assert retrieved.id == created.id
-        assert retrieved.questions_count == 5
-
-    def test_get_by_id_not_found(self, repository):
-        """Test retrieving non-existent report."""
-        report = repository.get_by_id(99999)
-        assert report is None
-
-    def test_get_by_chat_and_date(self, repository, test_chat):
-        """Test retrieving report by chat and date."""
-        report_date = date(2025, 10, 24)
-        created = repository.create(
-            chat_id=test_chat.id, report_date=report_date, questions_count=7
-        )
-
-        retrieved = repository.get_by_chat_and_date(test_chat.id, report_date)
-
-        assert retrieved is not None
-        assert retrieved.id == created.id
-        assert retrieved.questions_count == 7
-
-    def test_get_by_chat_and_date_not_found(self, repository, test_chat):
-        """Test retrieving non-existent report by chat and date."""
-        report = repository.get_by_chat_and_date(test_chat.id, date(2025, 10, 24))
-        assert report is None
-
-    def test_get_recent_by_chat(self, repository, test_chat):
+    def test_get_recent_by_chat(self, db_session, repository, test_chat):
         """Test retrieving recent reports for a chat."""
         # Create reports for multiple dates
         dates = [date(2025, 10, 24), date(2025, 10, 23), date(2025, 10, 22)]
-        for d in dates:
-            repository.create(chat_id=test_chat.id, report_date=d)
+        db_session.execute(
+            insert(Report),
+            [{"chat_id": test_chat.id, "report_date": d} for d in dates]
+        )
 
         recent = repository.get_recent_by_chat(test_chat.id, limit=2)
 
-        assert len(recent) == 2
         # Should be ordered by date descending
-        assert recent[0].report_date == date(2025, 10, 24)
-        assert recent[1].report_date == date(2025, 10, 23)
+        assert [r.report_date for r in recent] == [
+            date(2025, 10, 24), date(2025, 10, 23)
+        ]
 
     def test_get_recent_by_chat_empty(self, repository, test_chat):
         """Test retrieving recent reports when none exist."""
@@ -140,7 +186,7 @@ class TestReportRepository:
     def test_update_sent_at(self, repository, test_chat):
         """Test updating sent_at timestamp."""
         report = repository.create(
-            chat_id=test_chat.id, report_date=date(2025, 10, 24)
+            chat_id=test_chat.id, report_date=REPORT_DATE
         )
 
         assert report.sent_at is None
@@ -151,6 +197,11 @@ class TestReportRepository:
         assert updated is not None
         assert updated.sent_at == sent_time
 
+    def test_get_by_id_not_found(self, repository):
+        """Test retrieving non-existent report."""
+        report = repository.get_by_id(99999)
+        assert report is None
+
     def test_update_sent_at_not_found(self, repository):
         """Test updating sent_at for non-existent report."""
         updated = repository.update_sent_at(99999, datetime.now())
@@ -159,7 +210,7 @@ class TestReportRepository:
     def test_delete_report(self, repository, test_chat):
         """Test deleting a report."""
         report = repository.create(
-            chat_id=test_chat.id, report_date=date(2025, 10, 24)
+            chat_id=test_chat.id, report_date=REPORT_DATE
         )
 
         result = repository.delete(report.id)
@@ -174,7 +225,7 @@ class TestReportRepository:
         result = repository.delete(99999)
         assert result is False
 
-    def test_delete_old_reports(self, repository, test_chat):
+    def test_delete_old_reports(self, db_session, repository, test_chat):
         """Test deleting reports older than specified date."""
         # Create reports for different dates
         dates = [
@@ -184,8 +235,10 @@ class TestReportRepository:
             date(2025, 10, 23),
             date(2025, 10, 24),
         ]
-        for d in dates:
-            repository.create(chat_id=test_chat.id, report_date=d)
+        db_session.execute(
+            insert(Report),
+            [{"chat_id": test_chat.id, "report_date": d} for d in dates]
+        )
 
         # Delete reports before Oct 23
         count = repository.delete_old_reports(test_chat.id, date(2025, 10, 23))
@@ -195,24 +248,49 @@ class TestReportRepository:
 
         # Verify remaining reports
         remaining = repository.get_recent_by_chat(test_chat.id, limit=10)
-        assert len(remaining) == 2
-        assert remaining[0].report_date == date(2025, 10, 24)
-        assert remaining[1].report_date == date(2025, 10, 23)
+        assert [r.report_date for r in remaining] == [
+            date(2025, 10, 24), date(2025, 10, 23)
+        ]
 
     def test_delete_old_reports_none_match(self, repository, test_chat):
         """Test deleting old reports when none match criteria."""
-        repository.create(chat_id=test_chat.id, report_date=date(2025, 10, 24))
+        repository.create(chat_id=test_chat.id, report_date=REPORT_DATE)
 
         count = repository.delete_old_reports(test_chat.id, date(2025, 10, 20))
 
         assert count == 0
 
-    def test_report_chat_relationship(self, repository, test_chat):
-        """Test relationship between Report and Chat."""
-        report = repository.create(
-            chat_id=test_chat.id, report_date=date(2025, 10, 24)
+
+class TestReportRepositoryReads:
+    """Read-only ReportRepository tests against a pre-seeded report."""
+
+    def test_get_by_id(self, read_repository, seeded_report):
+        """Test retrieving report by ID."""
+        retrieved = read_repository.get_by_id(seeded_report.id)
+
+        assert retrieved is not None
+        assert retrieved.id == seeded_report.id
+        assert retrieved.questions_count == 7
+
+    def test_get_by_chat_and_date(self, read_repository, seeded_report, test_chat):
+        """Test retrieving report by chat and date."""
+        retrieved = read_repository.get_by_chat_and_date(test_chat.id, REPORT_DATE)
+
+        assert retrieved is not None
+        assert retrieved.id == seeded_report.id
+        assert retrieved.questions_count == 7
+
+    def test_get_by_chat_and_date_not_found(self, read_repository, test_chat):
+        """Test retrieving non-existent report by chat and date."""
+        report = read_repository.get_by_chat_and_date(
+            test_chat.id, REPORT_DATE - timedelta(days=1)
         )
+        assert report is None
+
+    def test_report_chat_relationship(self, read_repository, seeded_report, test_chat):
+        """Test relationship between Report and Chat."""
+        report = read_repository.get_by_id(seeded_report.id)
 
         assert report.chat is not None
         assert report.chat.id == test_chat.id
-        assert report.chat.chat_name == "Test Chat"
+        assert report.chat.chat_name == CHAT_NAME
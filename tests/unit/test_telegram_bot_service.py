@@ -0,0 +1,24 @@
+"""Unit tests for TelegramBotService."""
+
+from unittest.mock import patch
+
+from src.config.settings import Settings
+from src.services.telegram_bot_service import TelegramBotService
+
+
+class TestCreateApplication:
+    """Tests for Telegram application construction."""
+
+    @patch('src.services.telegram_bot_service.get_settings')
+    def test_create_application_uses_pooled_http2_client(self, mock_get_settings):
+        """Test Bot API requests use a pooled HTTP/2 client."""
+        mock_get_settings.return_value = Settings(
+            telegram_bot_token="123456:TEST_TOKEN",
+            bot_connection_pool_size=8
+        )
+
+        application = TelegramBotService().create_application()
+
+        request = application.bot.request
+        assert request.http_version == "2"
+        assert request._client_kwargs["limits"].max_connections == 8
@@ -0,0 +1,313 @@
+"""Unit tests for WebhookServer."""
+
+import asyncio
+import socket
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from telegram import Update
+from telegram.ext import ApplicationBuilder
+
+from src.config.settings import Settings
+from src.services.webhook_server import WebhookServer
+
+
+@pytest.fixture
+def webhook_settings():
+    """Create settings for webhook mode."""
+    return Settings(
+        telegram_bot_token="test_token",
+        anthropic_api_key="test_api_key",
+        webhook_enabled=True,
+        webhook_url="https://example.com/webhook",
+        webhook_secret_token="test_secret_token",
+        webhook_port=8080,
+        max_concurrent_updates=2
+    )
+
+
+class TestWebhookServerBackpressure:
+    """Tests for bounded concurrent update processing."""
+
+    @pytest.mark.asyncio
+    async def test_process_update_respects_concurrency_limit(
+        self,
+        webhook_settings
+    ):
+        """Test that no more than max_concurrent_updates run at once."""
+        active = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def slow_process_update(update):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await release.wait()
+            active -= 1
+
+        application = MagicMock()
+        application.process_update = slow_process_update
+        server = WebhookServer(application=application, settings=webhook_settings)
+
+        tasks = [
+            asyncio.create_task(server._process_update(MagicMock()))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+
+        assert active == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert peak == 2
+        assert active == 0
+
+
+def _make_update(text):
+    """Build a Telegram update carrying a group text message."""
+    return Update.de_json(
+        {
+            "update_id": 1,
+            "message": {
+                "message_id": 10,
+                "date": 1729728000,
+                "chat": {"id": -100123, "type": "supergroup", "title": "Test"},
+                "from": {"id": 42, "is_bot": False, "first_name": "Test"},
+                "text": text,
+            },
+        },
+        None
+    )
+
+
+class TestWebhookServerTextFastPath:
+    """Tests for direct dispatch of plain text messages."""
+
+    @pytest.fixture
+    def application(self):
+        """Create mock Telegram application."""
+        application = MagicMock()
+        application.process_update = AsyncMock()
+        application.process_error = AsyncMock()
+        return application
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Hello team", True),
+        ("/list_chats", False),
+        ("", False),
+        (None, False),
+    ])
+    def test_is_plain_text_message(self, text, expected):
+        """Test only non-command message text takes the fast path."""
+        assert WebhookServer._is_plain_text_message(_make_update(text)) is expected
+
+    def test_update_without_message_is_not_plain_text(self):
+        """Test updates carrying no message use the handler stack."""
+        update = Update.de_json({"update_id": 1}, None)
+
+        assert WebhookServer._is_plain_text_message(update) is False
+
+    @pytest.mark.asyncio
+    async def test_text_message_dispatched_to_callback(
+        self,
+        application,
+        webhook_settings
+    ):
+        """Test plain text messages bypass the handler stack."""
+        callback = AsyncMock()
+        server = WebhookServer(
+            application=application,
+            settings=webhook_settings,
+            text_message_callback=callback
+        )
+        update = _make_update("Hello team")
+
+        await server._process_update(update)
+
+        callback.assert_awaited_once()
+        assert callback.call_args[0][0] is update
+        application.process_update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_callback_error_dispatched_to_error_handlers(
+        self,
+        application,
+        webhook_settings
+    ):
+        """Test callback errors reach process_error instead of escaping."""
+        error = RuntimeError("collector failed")
+        callback = AsyncMock(side_effect=error)
+        server = WebhookServer(
+            application=application,
+            settings=webhook_settings,
+            text_message_callback=callback
+        )
+        update = _make_update("Hello team")
+
+        await server._process_update(update)
+
+        application.process_error.assert_awaited_once_with(update=update, error=error)
+        application.process_update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_callback_error_logged_without_error_handlers(
+        self,
+        webhook_settings,
+        caplog
+    ):
+        """Test callback errors are logged like the handler stack logs them."""
+        application = ApplicationBuilder().token("123:test").build()
+        server = WebhookServer(
+            application=application,
+            settings=webhook_settings,
+            text_message_callback=AsyncMock(side_effect=RuntimeError("collector failed"))
+        )
+
+        await server._process_update(_make_update("Hello team"))
+
+        assert "No error handlers are registered" in caplog.text
+        assert "collector failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_command_falls_back_to_process_update(
+        self,
+        application,
+        webhook_settings
+    ):
+        """Test commands are routed through the full handler stack."""
+        callback = AsyncMock()
+        server = WebhookServer(
+            application=application,
+            settings=webhook_settings,
+            text_message_callback=callback
+        )
+        update = _make_update("/list_chats")
+
+        await server._process_update(update)
+
+        callback.assert_not_called()
+        application.process_update.assert_awaited_once_with(update)
+
+    @pytest.mark.asyncio
+    async def test_without_callback_uses_process_update(
+        self,
+        application,
+        webhook_settings
+    ):
+        """Test text messages use process_update when no callback is set."""
+        server = WebhookServer(application=application, settings=webhook_settings)
+        update = _make_update("Hello team")
+
+        await server._process_update(update)
+
+        application.process_update.assert_awaited_once_with(update)
+
+
+class TestWebhookServerSecretToken:
+    """Tests for secret token validation."""
+
+    @pytest.mark.parametrize("header_value,expected", [
+        ("test_secret_token", True),
+        ("wrong_token", False),
+        ("", False),
+        ("tökén", False),
+    ])
+    def test_validate_secret_token(self, webhook_settings, header_value, expected):
+        """Test header token is compared against configured secret."""
+        server = WebhookServer(application=MagicMock(), settings=webhook_settings)
+        request = MagicMock()
+        request.headers = {"X-Telegram-Bot-Api-Secret-Token": header_value}
+
+        assert server._validate_secret_token(request) is expected
+
+    def test_validate_secret_token_not_configured(self, webhook_settings):
+        """Test requests are allowed when no secret token is configured."""
+        webhook_settings.webhook_secret_token = ""
+        server = WebhookServer(application=MagicMock(), settings=webhook_settings)
+        request = MagicMock()
+        request.headers = {}
+
+        assert server._validate_secret_token(request) is True
+
+
+class TestWebhookServerLifecycle:
+    """Tests for webhook server start/stop."""
+
+    @pytest.mark.asyncio
+    async def test_start_stop_with_reuse_port(self, webhook_settings):
+        """Test server binds with SO_REUSEPORT when configured."""
+        webhook_settings.webhook_port = 0
+        webhook_settings.webhook_reuse_port = True
+        server = WebhookServer(application=MagicMock(), settings=webhook_settings)
+
+        await server.start()
+        try:
+            sockets = server.site._server.sockets
+            assert sockets[0].getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT) != 0
+        finally:
+            await server.stop()
+
+    def test_listen_socket_options(self, webhook_settings):
+        """Test listening socket allows address reuse but not port reuse by default."""
+        webhook_settings.webhook_port = 0
+        server = WebhookServer(application=MagicMock(), settings=webhook_settings)
+
+        sock = server._create_listen_socket()
+        try:
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR) != 0
+            assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT) == 0
+        finally:
+            sock.close()
+
+    @pytest.mark.asyncio
+    async def test_start_registers_routes(self, webhook_settings):
+        """Test webhook and health routes are registered on start."""
+        webhook_settings.webhook_port = 0
+        server = WebhookServer(application=MagicMock(), settings=webhook_settings)
+
+        await server.start()
+        try:
+            routes = {
+                (route.method, route.resource.canonical)
+                for route in server.app.router.routes()
+            }
+            assert ("POST", "/webhook") in routes
+            assert ("GET", "/health") in routes
+            assert server.app.frozen
+        finally:
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_handle_health_returns_ok(self, webhook_settings):
+        """Test health endpoint returns 200 with a static body."""
+        server = WebhookServer(application=MagicMock(), settings=webhook_settings)
+
+        response = await server.handle_health(MagicMock())
+
+        assert response.status == 200
+        assert response.body == b"OK"
+
+
+class TestWebhookServerIpValidation:
+    """Tests for Telegram IP whitelist validation."""
+
+    @pytest.mark.parametrize("ip_address,expected", [
+        ("149.154.160.0", True),
+        ("149.154.167.220", True),
+        ("149.154.175.255", True),
+        ("91.108.4.1", True),
+        ("91.108.7.255", True),
+        ("149.154.176.0", False),
+        ("91.108.8.0", False),
+        ("127.0.0.1", False),
+        ("::ffff:959a:a001", False),
+        ("not-an-ip", False),
+        ("", False),
+    ])
+    def test_is_telegram_ip(self, webhook_settings, ip_address, expected):
+        """Test only addresses inside Telegram ranges are accepted."""
+        server = WebhookServer(application=MagicMock(), settings=webhook_settings)
+
+        assert server._is_telegram_ip(ip_address) is expected